@@ -4,49 +4,183 @@ This module provides the custom drawing canvas widget that handles image display
 user input events, tool interactions, and text entry overlays.
 """
 
+import array
+import sys
+from dataclasses import dataclass, field
+
 import gi  # noqa: E402
 import cairo
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk  # noqa: E402
+gi.require_version("Gsk", "4.0")
+gi.require_version("Graphene", "1.0")
+from gi.repository import Gtk, Gdk, GLib, Gsk, Graphene  # noqa: E402
+
+from .manager import Tool  # noqa: E402
+
+# Key constants bound once instead of looked up on Gdk per event
+_CTRL = Gdk.ModifierType.CONTROL_MASK
+_SHIFT_OR_CTRL = Gdk.ModifierType.SHIFT_MASK | Gdk.ModifierType.CONTROL_MASK
+_KEY_RET = Gdk.KEY_Return
+_KEY_KPRET = Gdk.KEY_KP_Enter
+
+# Quiet period after the last Ctrl+wheel tick before a zoom counts as settled
+_ZOOM_SETTLE_MS = 150
+
+# Cairo's ARGB32 is a native-endian 32-bit word
+_CAIRO_MEMORY_FORMAT = (
+    Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED
+    if sys.byteorder == "little"
+    else Gdk.MemoryFormat.A8R8G8B8_PREMULTIPLIED
+)
+
+
+# Resize cursor shown while hovering each canvas resize handle
+HANDLE_TO_CURSOR = {
+    "top-left": "nwse-resize",
+    "bottom-right": "nwse-resize",
+    "top-right": "nesw-resize",
+    "bottom-left": "nesw-resize",
+    "left": "ew-resize",
+    "right": "ew-resize",
+    "top": "ns-resize",
+    "bottom": "ns-resize",
+}
+
+
+def _rgba(red, green, blue, alpha):
+    """Builds a Gdk.RGBA from float channels."""
+    color = Gdk.RGBA()
+    color.red, color.green, color.blue, color.alpha = red, green, blue, alpha
+    return color
+
+
+_BACKGROUND_RGBA = _rgba(0.1, 0.1, 0.1, 1.0)
+_CANVAS_BORDER_RGBA = _rgba(0.0, 0.0, 0.0, 0.3)
+_HANDLE_SHADOW_RGBA = _rgba(0.1, 0.1, 0.1, 0.5)
+_HANDLE_FILL_RGBA = _rgba(1.0, 1.0, 1.0, 0.9)
+_HANDLE_BORDER_RGBA = _rgba(0.1, 0.1, 0.1, 0.8)
+
+
+def surface_to_texture(surface: cairo.ImageSurface) -> Gdk.Texture:
+    """Copies the pixels of an ARGB32 Cairo surface into a GDK texture.
+
+    Args:
+        surface: The Cairo image surface to convert.
+
+    Returns:
+        A memory texture holding the same premultiplied pixels.
+    """
+    surface.flush()
+    # GLib owns its copy, so the pixels stay valid for every holder of the
+    # texture's bytes, whatever happens to the Python objects
+    data = GLib.Bytes.new(bytes(surface.get_data()))
+    return Gdk.MemoryTexture.new(
+        surface.get_width(),
+        surface.get_height(),
+        _CAIRO_MEMORY_FORMAT,
+        data,
+        surface.get_stride(),
+    )
+
+
+def texture_to_surface(texture: Gdk.Texture) -> cairo.ImageSurface:
+    """Downloads a GDK texture into a new ARGB32 Cairo surface.
 
+    The pixels are copied once, straight into the Cairo-owned buffer of the
+    new surface.
 
-def _create_text_css_provider(
+    Args:
+        texture: The texture to convert, e.g. one read from the clipboard.
+
+    Returns:
+        An image surface holding the texture's pixels in Cairo's format.
+    """
+    width, height = texture.get_width(), texture.get_height()
+    downloader = Gdk.TextureDownloader.new(texture)
+    downloader.set_format(_CAIRO_MEMORY_FORMAT)
+    data, src_stride = downloader.download_bytes()
+    pixels = data.get_data()
+
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    dst = surface.get_data()
+    dst_stride = surface.get_stride()
+    if src_stride == dst_stride:
+        dst[: dst_stride * height] = pixels[: dst_stride * height]
+    else:
+        row = width * 4
+        for y in range(height):
+            src_start = y * src_stride
+            dst_start = y * dst_stride
+            dst[dst_start : dst_start + row] = pixels[src_start : src_start + row]
+    surface.mark_dirty()
+    return surface
+
+
+# Only the per-color/size rules live here; the static text overlay rules are
+# part of the application stylesheet registered once for the display.
+_TEXT_CSS_TEMPLATE = b"""
+textview.canvas-text-overlay {
+    color: rgba(%d, %d, %d, %.4f);
+    caret-color: rgba(%d, %d, %d, %.4f);
+    font-size: %.1fpx;
+}
+
+textview.canvas-text-overlay border {
+    border-color: rgba(%d, %d, %d, 0.7);
+}
+"""
+
+
+def _text_css(
     color_rgba: tuple = (255, 255, 255, 255),
     font_size: float = 20.0,
-) -> Gtk.CssProvider:
-    """Creates a CSS provider with the specified text color.
+) -> bytes:
+    """Builds the text entry stylesheet for a color and font size.
 
     Args:
         color_rgba: RGBA color tuple (0-255). Defaults to white.
         font_size: Font size in pixels. Defaults to 20.0.
 
     Returns:
-        A GTK CSS provider configured for text entry styling.
+        CSS bytes ready for Gtk.CssProvider.load_from_data().
     """
     r, g, b, a = color_rgba
-    # Convert 0-255 to CSS rgba string
-    css = f"""
-    textview.canvas-text-overlay {{
-        background-color: transparent;
-        color: rgba({r}, {g}, {b}, {a/255.0});
-        caret-color: rgba({r}, {g}, {b}, {a/255.0});
-        font-size: {font_size}px;
-    }}
-    
-    textview.canvas-text-overlay text,
-    textview.canvas-text-overlay view {{
-        background-color: transparent;
-    }}
-    
-    textview.canvas-text-overlay border {{
-        border: 1px dashed rgba({r}, {g}, {b}, 0.7);
-        border-radius: 4px;
-    }}
-    """
-    provider = Gtk.CssProvider()
-    provider.load_from_data(css.encode("utf-8"))
-    return provider
+    alpha = a / 255.0
+    return _TEXT_CSS_TEMPLATE % (r, g, b, alpha, r, g, b, alpha, font_size, r, g, b)
+
+
+def _iround(v):
+    """Rounds half away from zero to int; cheaper than int(round(v))."""
+    return int(v + 0.5) if v >= 0 else -int(-v + 0.5)
+
+
+def _rect_contains(rect, x, y):
+    """Returns True if (x, y) lies inside an (x1, y1, x2, y2) rectangle."""
+    return rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]
+
+
+def _rects_intersect(a, b, pad=0):
+    """Returns True if two (x1, y1, x2, y2) rectangles overlap, `a` grown by pad."""
+    return (
+        a[0] - pad <= b[2]
+        and b[0] <= a[2] + pad
+        and a[1] - pad <= b[3]
+        and b[1] <= a[3] + pad
+    )
+
+
+@dataclass(slots=True)
+class _DragState:
+    """Mutable pointer-interaction state read on every drag and motion event."""
+
+    # 'none', 'select', 'move', 'move_crop_image', 'brush', 'text_create'
+    mode: str = "none"
+    start_point: tuple = None
+    start_offset: tuple = (0, 0)
+    start_pan_offset: tuple = (0, 0)
+    # Brush points not yet drawn, stored flat as x0, y0, x1, y1, ...
+    pending_points: array.array = field(default_factory=lambda: array.array("i"))
 
 
 class CanvasWidget(Gtk.DrawingArea):
@@ -59,6 +193,45 @@ class CanvasWidget(Gtk.DrawingArea):
     RESIZE_HANDLE_SIZE = 12
     RESIZE_HANDLE_MARGIN = 8
 
+    # Named cursors shared by all canvases, created on first use
+    _CURSOR_CACHE = {}
+
+    # How a pointer delta along x/y grows the canvas for each handle
+    _HANDLE_SIGNS = {
+        "top-left": (-1, -1),
+        "top": (0, -1),
+        "top-right": (1, -1),
+        "right": (1, 0),
+        "bottom-right": (1, 1),
+        "bottom": (0, 1),
+        "bottom-left": (-1, 1),
+        "left": (-1, 0),
+    }
+
+    # Canvas edge kept fixed while each handle is dragged
+    _HANDLE_ANCHORS = {
+        "top-left": ("right", "bottom"),
+        "top": ("left", "bottom"),
+        "top-right": ("left", "bottom"),
+        "right": ("left", "top"),
+        "bottom-right": ("left", "top"),
+        "bottom": ("left", "top"),
+        "bottom-left": ("right", "top"),
+        "left": ("right", "top"),
+    }
+
+    # Handle centers as fractions of the displayed image width/height
+    _HANDLE_OFFSETS = (
+        (0, 0),
+        (0.5, 0),
+        (1, 0),
+        (0, 0.5),
+        (1, 0.5),
+        (0, 1),
+        (0.5, 1),
+        (1, 1),
+    )
+
     def __init__(self, processor, manager):
         super().__init__()
         self.processor = processor
@@ -66,20 +239,30 @@ class CanvasWidget(Gtk.DrawingArea):
 
         self.set_draw_func(self.on_draw)
         self.selection_box = None
-        self._start_point = None
-        self._stroke_points = []
+        self._drag = _DragState()
+        self._tick_cb_id = None
         self._text_entry = None
+        self._text_css_provider = None
+        self._text_css = None
         self._overlay = None
         self._text_entry_pos = None
         self._text_entry_initial_dims = None
-        self._drag_mode = "none"  # 'none', 'select', 'move', 'move_crop_image'
-        self._drag_start_offset = (0, 0)
-        self._start_pan_offset = (0, 0)
         self._image_display_rect = None
+        self._handle_rects = ()
+        self._handles_node_rect = None
+        self._handles_node = None
+        self._geom_dirty = True
+        self._geom_key = None
+        self._texture = None
+        self._texture_revision = None
+        self._selection_canvas_box = None
+        self._selection_canvas_rect = None
         self._hover_resize_handle = None
+        self._current_cursor_name = None
         self._active_resize_handle = None
         self._resize_start_pointer = None
         self._resize_start_size = None
+        self._last_applied_size = None
         self._resize_anchor = ("left", "top")
         self._canvas_resize_in_progress = False
 
@@ -87,6 +270,11 @@ class CanvasWidget(Gtk.DrawingArea):
         self._zoom_level = 1.0
         self._min_zoom = 0.1
         self._max_zoom = 10.0
+        self._pending_zoom_factor = 1.0
+        self._zoom_idle_id = None
+        # Pending timeout marking the end of a zoom burst; set while zooming
+        self._zoom_settle_id = None
+        self._redraw_pending = False
 
         # Drag gesture
         drag = Gtk.GestureDrag.new()
@@ -110,10 +298,25 @@ class CanvasWidget(Gtk.DrawingArea):
         scroll.connect("scroll", self.on_scroll)
         self.add_controller(scroll)
 
+        # Display geometry only changes with allocation, zoom or image size
+        self.connect("resize", self.on_resize)
+        self.processor.connect_surface_replaced(self.invalidate_geometry)
+
     def set_overlay(self, overlay):
         """Store a reference to the overlay that wraps this canvas.
         Do not try to replace the overlay's child from here — MainWindow controls that."""
         self._overlay = overlay
+        self.invalidate_geometry()
+
+    def invalidate_geometry(self):
+        """Marks the cached display geometry as stale until its next use."""
+        self._geom_dirty = True
+        self._image_display_rect = None
+        self._selection_canvas_box = None
+        self._selection_canvas_rect = None
+
+    def on_resize(self, area, width, height):
+        self.invalidate_geometry()
 
     def _update_text_entry_size(self, font_size):
         """Update the size request of the text entry based on font size."""
@@ -129,7 +332,9 @@ class CanvasWidget(Gtk.DrawingArea):
         req_w = max(150, int(cw))
         req_h = max(30, int(ch), int(required_h))
 
-        self._text_entry.set_size_request(req_w, req_h)
+        # A color-only change keeps the size; skip the relayout it would queue
+        if self._text_entry.get_size_request() != (req_w, req_h):
+            self._text_entry.set_size_request(req_w, req_h)
 
     def show_text_entry(self, x, y, w, h):
         """Create a text entry positioned over the canvas at the given image coords."""
@@ -147,6 +352,13 @@ class CanvasWidget(Gtk.DrawingArea):
         # Use a TextView for multiline support
         self._text_entry = Gtk.TextView()
         self._text_entry.set_wrap_mode(Gtk.WrapMode.NONE)
+        self._text_entry.add_css_class("canvas-text-overlay")
+        # One provider per entry; restyling reloads it in place
+        self._text_css_provider = Gtk.CssProvider()
+        self._text_css = None
+        self._text_entry.get_style_context().add_provider(
+            self._text_css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
 
         # Apply current color
         color = self.processor._brush_color
@@ -182,17 +394,25 @@ class CanvasWidget(Gtk.DrawingArea):
         """
         Calculates and caches the image's display geometry (position, size, scale).
         This is the single source of truth for widget<->image coordinate mapping.
+        The cached value is reused until invalidate_geometry() is called or the
+        image size, widget size or zoom level differ from the last computation.
         """
-        if not self.processor.current_image:
+        image_size = self.processor.image_size
+        widget_w, widget_h = self.get_width(), self.get_height()
+        key = (image_size, widget_w, widget_h, self._zoom_level)
+        if key != self._geom_key:
+            self._geom_key = key
+            self.invalidate_geometry()
+        if not self._geom_dirty:
+            return self._image_display_rect
+        self._geom_dirty = False
+        self._handle_rects = ()
+
+        if not image_size:
             self._image_display_rect = None
             return None
 
-        alloc = self.get_allocation()
-        widget_w, widget_h = alloc.width, alloc.height
-        img_w, img_h = (
-            self.processor.current_image.get_width(),
-            self.processor.current_image.get_height(),
-        )
+        img_w, img_h = image_size
 
         if img_w == 0 or img_h == 0 or widget_w == 0 or widget_h == 0:
             self._image_display_rect = None
@@ -226,48 +446,111 @@ class CanvasWidget(Gtk.DrawingArea):
             display_height,
             scale,
         )
+        self._handle_rects = self._compute_handle_rects(
+            x_offset, y_offset, display_width, display_height
+        )
         return self._image_display_rect
 
-    def on_draw(self, area, cr, width, height):
-        """The draw function."""
-        geom = self._calculate_image_display_geometry()
-        if not geom or not self.processor.current_image:
-            # Draw a background if no image
-            cr.set_source_rgb(0.1, 0.1, 0.1)
-            cr.paint()
-            return
+    def _compute_handle_rects(self, x, y, w, h):
+        """Builds the resize-handle hit boxes as (name, x1, x2, y1, y2) tuples.
 
-        x_offset, y_offset, _, _, scale = geom
+        Corners come first so they win over the edges they overlap.
+        """
+        if w <= 0 or h <= 0:
+            return ()
+        m = self.RESIZE_HANDLE_MARGIN
+        x0, x1 = x, x + w
+        y0, y1 = y, y + h
+        return (
+            ("top-left", x0 - m, x0 + m, y0 - m, y0 + m),
+            ("top-right", x1 - m, x1 + m, y0 - m, y0 + m),
+            ("bottom-left", x0 - m, x0 + m, y1 - m, y1 + m),
+            ("bottom-right", x1 - m, x1 + m, y1 - m, y1 + m),
+            ("top", x0 - m, x1 + m, y0 - m, y0 + m),
+            ("bottom", x0 - m, x1 + m, y1 - m, y1 + m),
+            ("left", x0 - m, x0 + m, y0 - m, y1 + m),
+            ("right", x1 - m, x1 + m, y0 - m, y1 + m),
+        )
 
-        # Draw background
-        cr.set_source_rgb(0.1, 0.1, 0.1)
-        cr.paint()
+    def do_snapshot(self, snapshot):
+        """Renders the background, image and resize handles as GPU render nodes.
 
-        # Draw image
+        The image is uploaded as a texture once per change and scaled by GSK.
+        The Cairo draw function is chained up in between for the selection
+        and crop overlays, so the handles stay on top of them.
+        """
+        bounds = Graphene.Rect().init(0, 0, self.get_width(), self.get_height())
+        snapshot.push_clip(bounds)
+        snapshot.append_color(_BACKGROUND_RGBA, bounds)
+
+        geom = self._calculate_image_display_geometry()
         surface = self.processor.current_image
-        cr.save()
-        cr.translate(x_offset, y_offset)
-        cr.scale(scale, scale)
+        if geom and surface:
+            x_offset, y_offset, display_w, display_h, scale = geom
+            if self.processor._is_cropping:
+                pan_x, pan_y = self.processor._crop_pan_offset
+            else:
+                pan_x, pan_y = 0, 0
+            rect = Graphene.Rect().init(
+                x_offset + pan_x * scale, y_offset + pan_y * scale, display_w, display_h
+            )
+            # Mipmapped filtering only once the view settles; drags and zoom
+            # bursts get the cheaper linear filter
+            if self._drag.mode == "none" and self._zoom_settle_id is None:
+                scaling_filter = Gsk.ScalingFilter.TRILINEAR
+            else:
+                scaling_filter = Gsk.ScalingFilter.LINEAR
+            snapshot.append_scaled_texture(
+                self._get_texture(surface), scaling_filter, rect
+            )
 
-        if self.processor._is_cropping:
-            pan_x, pan_y = self.processor._crop_pan_offset
-            cr.set_source_surface(surface, pan_x, pan_y)
-        else:
-            cr.set_source_surface(surface, 0, 0)
+        # Selection and crop overlays are still drawn by on_draw; without
+        # one there is no Cairo node to build
+        if geom and surface and self._has_cairo_overlay():
+            Gtk.DrawingArea.do_snapshot(self, snapshot)
+        if geom and surface:
+            self._snapshot_resize_handles(snapshot)
+        snapshot.pop()
+
+    def _has_cairo_overlay(self) -> bool:
+        """Returns whether on_draw has a selection or crop overlay to draw."""
+        processor = self.processor
+        if processor._selection_box and (
+            processor._is_cropping or not processor._floating_selection_data
+        ):
+            return True
+        return bool(self.selection_box) and self._drag.mode in (
+            "select",
+            "text_create",
+        )
 
-        cr.get_source().set_filter(cairo.FILTER_BEST)
-        cr.paint()
-        cr.restore()
+    def _get_texture(self, surface):
+        """Returns the image as a GDK texture, rebuilt only when it changed."""
+        revision = self.processor.revision
+        if self._texture is None or revision != self._texture_revision:
+            self._texture = surface_to_texture(surface)
+            self._texture_revision = revision
+        return self._texture
+
+    def on_draw(self, area, cr, width, height):
+        """Draws the selection and crop overlays."""
+        if not self.get_mapped():
+            return
+        clip = cr.clip_extents()
+        if clip[2] <= clip[0] or clip[3] <= clip[1]:
+            return
+
+        geom = self._calculate_image_display_geometry()
+        if not geom or not self.processor.current_image:
+            return
 
         # Draw crop overlay or selection rectangle
         if self.processor._is_cropping and self.processor._selection_box:
             cr.save()
             x, y, w, h = self.processor._selection_box
-            p1 = self._image_to_canvas_coords(x, y)
-            p2 = self._image_to_canvas_coords(x + w, y + h)
-            if p1 and p2:
-                canvas_x, canvas_y = p1
-                canvas_w, canvas_h = p2[0] - p1[0], p2[1] - p1[1]
+            canvas_rect = self._image_box_to_canvas_rect(x, y, x + w, y + h)
+            if canvas_rect:
+                canvas_x, canvas_y, canvas_w, canvas_h = canvas_rect
 
                 cr.rectangle(0, 0, width, height)
                 cr.rectangle(canvas_x, canvas_y, canvas_w, canvas_h)
@@ -286,85 +569,88 @@ class CanvasWidget(Gtk.DrawingArea):
             and not self.processor._floating_selection_data
         ):
             x, y, w, h = self.processor._selection_box
-            p1 = self._image_to_canvas_coords(x, y)
-            p2 = self._image_to_canvas_coords(x + w, y + h)
-            if p1 and p2:
+            canvas_rect = self._image_box_to_canvas_rect(x, y, x + w, y + h)
+            if canvas_rect:
+                cx, cy, cw, ch = canvas_rect
+                if _rects_intersect((cx, cy, cx + cw, cy + ch), clip, pad=2):
+                    cr.save()
+                    cr.set_source_rgba(0.1, 0.4, 0.8, 0.5)
+                    cr.set_dash([5, 5])
+                    cr.set_line_width(2)
+                    cr.rectangle(cx, cy, cw, ch)
+                    cr.stroke()
+                    cr.restore()
+        elif (
+            self._drag.mode == "select" or self._drag.mode == "text_create"
+        ) and self.selection_box:
+            x, y, w, h = self.selection_box
+            if _rects_intersect((x, y, x + w, y + h), clip, pad=2):
                 cr.save()
                 cr.set_source_rgba(0.1, 0.4, 0.8, 0.5)
                 cr.set_dash([5, 5])
                 cr.set_line_width(2)
-                cr.rectangle(p1[0], p1[1], p2[0] - p1[0], p2[1] - p1[1])
+                cr.rectangle(x, y, w, h)
                 cr.stroke()
                 cr.restore()
-        elif (
-            self._drag_mode == "select" or self._drag_mode == "text_create"
-        ) and self.selection_box:
-            cr.save()
-            cr.set_source_rgba(0.1, 0.4, 0.8, 0.5)
-            cr.set_dash([5, 5])
-            cr.set_line_width(2)
-            x, y, w, h = self.selection_box
-            cr.rectangle(x, y, w, h)
-            cr.stroke()
-            cr.restore()
-
-        self._draw_resize_handles(cr)
 
     def on_motion(self, controller, x, y):
         if self._canvas_resize_in_progress:
             return
         # Ensure geometry is calculated before hit testing
-        self._calculate_image_display_geometry()
+        if self._image_display_rect is None:
+            self._calculate_image_display_geometry()
         handle = self._hit_test_resize_handle(x, y)
-        if handle != self._hover_resize_handle:
-            self._hover_resize_handle = handle
+        self._hover_resize_handle = handle
+        if handle:
             self._update_cursor_for_handle(handle)
+            return
 
-        if not handle and self.processor._is_cropping and self.processor._selection_box:
-            sel_x, sel_y, sel_w, sel_h = self.processor._selection_box
-            p1 = self._image_to_canvas_coords(sel_x, sel_y)
-            p2 = self._image_to_canvas_coords(sel_x + sel_w, sel_y + sel_h)
-            if p1 and p2:
-                cx1, cy1 = p1
-                cx2, cy2 = p2
-                if cx1 <= x <= cx2 and cy1 <= y <= cy2:
-                    cursor = Gdk.Cursor.new_from_name("move")
-                    self.set_cursor(cursor)
-                elif self._hover_resize_handle is None:
-                    self.set_cursor(None)
-
-        elif not handle and self.manager.current_tool == "select":
-            # Check for hover over selection box (floating or not)
-            box = None
-            if self.processor._floating_selection_data:
-                # If floating, use its position
-                pos = self.processor._floating_selection_position
-                w = self.processor._floating_selection_data.get_width()
-                h = self.processor._floating_selection_data.get_height()
-                box = (pos[0], pos[1], w, h)
-            elif self.processor._selection_box:
-                box = self.processor._selection_box
-
-            if box:
-                bx, by, bw, bh = box
-                p1 = self._image_to_canvas_coords(bx, by)
-                p2 = self._image_to_canvas_coords(bx + bw, by + bh)
-                if p1 and p2:
-                    cx1, cy1 = p1
-                    cx2, cy2 = p2
-                    if cx1 <= x <= cx2 and cy1 <= y <= cy2:
-                        cursor = Gdk.Cursor.new_from_name("move")
-                        self.set_cursor(cursor)
-                    elif self._hover_resize_handle is None:
-                        self.set_cursor(None)
-                elif self._hover_resize_handle is None:
-                    self.set_cursor(None)
-            elif self._hover_resize_handle is None:
-                self.set_cursor(None)
-
-        elif not handle and self._hover_resize_handle is None:
-            # Ensure cursor is reset if we left the handle and aren't over crop or selection
-            self.set_cursor(None)
+        box = self._active_hover_box()
+        rect = self._get_selection_canvas_rect(box) if box else None
+        if rect and _rect_contains(rect, x, y):
+            self._set_cursor_name("move")
+        else:
+            self._set_cursor_name(None)
+
+    def _active_hover_box(self):
+        """Returns the image-space box that shows a move cursor on hover, if any."""
+        processor = self.processor
+        if processor._is_cropping and processor._selection_box:
+            return processor._selection_box
+        if self.manager.current_tool != Tool.SELECT:
+            return None
+        if processor._floating_selection_data:
+            x, y = processor._floating_selection_position
+            return (
+                x,
+                y,
+                processor._floating_selection_data.get_width(),
+                processor._floating_selection_data.get_height(),
+            )
+        return processor._selection_box
+
+    def _get_selection_canvas_rect(self, box):
+        """Returns the canvas rect (x1, y1, x2, y2) of an image-space box.
+
+        The result is cached for hover testing and reused until the box or the
+        display geometry changes.
+
+        Args:
+            box: Image-space (x, y, w, h) tuple.
+
+        Returns:
+            The canvas-space corners, or None if there is no display geometry.
+        """
+        if box != self._selection_canvas_box or self._selection_canvas_rect is None:
+            bx, by, bw, bh = box
+            rect = self._image_box_to_canvas_rect(bx, by, bx + bw, by + bh)
+            self._selection_canvas_box = box
+            self._selection_canvas_rect = (
+                (rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])
+                if rect
+                else None
+            )
+        return self._selection_canvas_rect
 
     def on_motion_leave(self, controller):
         if self._canvas_resize_in_progress:
@@ -378,25 +664,69 @@ class CanvasWidget(Gtk.DrawingArea):
         event = controller.get_current_event()
         if event:
             state = event.get_modifier_state()
-            ctrl = state & Gdk.ModifierType.CONTROL_MASK
+            ctrl = state & _CTRL
 
             if ctrl:
                 # Zoom in/out
                 zoom_factor = 1.1
                 if dy < 0:  # Scroll up
-                    new_zoom = self._zoom_level * zoom_factor
+                    self._pending_zoom_factor *= zoom_factor
                 else:  # Scroll down
-                    new_zoom = self._zoom_level / zoom_factor
+                    self._pending_zoom_factor /= zoom_factor
 
-                # Clamp zoom level
-                self._zoom_level = max(self._min_zoom, min(self._max_zoom, new_zoom))
-                self.queue_draw()
+                # Apply a burst of wheel ticks as a single redraw
+                if self._zoom_idle_id is None:
+                    self._zoom_idle_id = GLib.idle_add(
+                        self._apply_pending_zoom, priority=GLib.PRIORITY_DEFAULT_IDLE
+                    )
+                # The zoom counts as in progress until no wheel tick has
+                # arrived for _ZOOM_SETTLE_MS
+                if self._zoom_settle_id is not None:
+                    GLib.source_remove(self._zoom_settle_id)
+                self._zoom_settle_id = GLib.timeout_add(
+                    _ZOOM_SETTLE_MS, self._on_zoom_settled
+                )
                 return True
         return False
 
+    def request_redraw(self):
+        """Schedules one redraw for a burst of model changes.
+
+        Repeated requests before the idle callback runs are folded into it,
+        so key-repeat undo or back-to-back edits cost a single redraw.
+        """
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        GLib.idle_add(self._do_redraw, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.queue_draw()
+        return GLib.SOURCE_REMOVE
+
+    def _apply_pending_zoom(self):
+        """Idle callback applying the zoom accumulated from scroll events."""
+        self._zoom_idle_id = None
+        new_zoom = self._zoom_level * self._pending_zoom_factor
+        self._pending_zoom_factor = 1.0
+
+        # Clamp zoom level
+        self._zoom_level = max(self._min_zoom, min(self._max_zoom, new_zoom))
+        self.invalidate_geometry()
+        self.queue_draw()
+        return GLib.SOURCE_REMOVE
+
+    def _on_zoom_settled(self):
+        """Timeout callback redrawing with the settled-view filter."""
+        self._zoom_settle_id = None
+        self.queue_draw()
+        return GLib.SOURCE_REMOVE
+
     def on_drag_begin(self, gesture, start_x, start_y):
         # Ensure geometry is calculated before any drag logic
-        self._calculate_image_display_geometry()
+        if self._image_display_rect is None:
+            self._calculate_image_display_geometry()
         handle = self._hit_test_resize_handle(start_x, start_y)
         if handle and self.processor.current_image:
             self._active_resize_handle = handle
@@ -405,6 +735,7 @@ class CanvasWidget(Gtk.DrawingArea):
                 self.processor.current_image.get_width(),
                 self.processor.current_image.get_height(),
             )
+            self._last_applied_size = self._resize_start_size
             self._resize_anchor = self._anchor_for_handle(handle)
             self._canvas_resize_in_progress = True
             gesture.set_state(Gtk.EventSequenceState.CLAIMED)
@@ -415,9 +746,9 @@ class CanvasWidget(Gtk.DrawingArea):
             p1 = self._image_to_canvas_coords(sel_x, sel_y)
             p2 = self._image_to_canvas_coords(sel_x + sel_w, sel_y + sel_h)
             if p1 and p2 and p1[0] <= start_x <= p2[0] and p1[1] <= start_y <= p2[1]:
-                self._drag_mode = "move_crop_image"
-                self._drag_start_offset = (start_x, start_y)
-                self._start_pan_offset = self.processor._crop_pan_offset
+                self._drag.mode = "move_crop_image"
+                self._drag.start_offset = (start_x, start_y)
+                self._drag.start_pan_offset = tuple(self.processor._crop_pan_offset)
                 return
 
         # If we are already editing text, clicking outside should commit it.
@@ -426,15 +757,15 @@ class CanvasWidget(Gtk.DrawingArea):
             self._finalize_text_entry()
 
         self.hide_text_entry()
-        self._start_point = (start_x, start_y)
+        self._drag.start_point = (start_x, start_y)
         current_tool = self.manager.current_tool
 
-        if current_tool == "text":
-            self._drag_mode = "text_create"
+        if current_tool == Tool.TEXT:
+            self._drag.mode = "text_create"
             self.selection_box = None
             return
 
-        if current_tool == "select":
+        if current_tool == Tool.SELECT:
             if self.processor._floating_selection_data:
                 # Check if drag starts inside the floating selection
                 f_pos = self.processor._floating_selection_position
@@ -451,15 +782,15 @@ class CanvasWidget(Gtk.DrawingArea):
                     and w_coords[0] <= start_x <= w_coords2[0]
                     and w_coords[1] <= start_y <= w_coords2[1]
                 ):
-                    self._drag_mode = "move"
-                    self._drag_start_offset = (
+                    self._drag.mode = "move"
+                    self._drag.start_offset = (
                         start_x - w_coords[0],
                         start_y - w_coords[1],
                     )
                 else:
                     # Clicked outside, so paste and start new selection
                     self.processor.paste_selection()
-                    self._drag_mode = "select"
+                    self._drag.mode = "select"
 
             elif self.processor._selection_box:
                 # Check if drag starts inside existing selection box
@@ -475,39 +806,40 @@ class CanvasWidget(Gtk.DrawingArea):
                 ):
                     # Cut selection to make it floating
                     self.processor.cut_selection(self.processor._selection_box)
-                    self._drag_mode = "move"
+                    self._drag.mode = "move"
 
                     # p1 is canvas coord of selection top-left
-                    self._drag_start_offset = (
+                    self._drag.start_offset = (
                         start_x - p1[0],
                         start_y - p1[1],
                     )
                     self.queue_draw()
                 else:
-                    self._drag_mode = "select"
+                    self._drag.mode = "select"
 
             else:
-                self._drag_mode = "select"
+                self._drag.mode = "select"
 
-        elif current_tool == "brush":
-            self._drag_mode = "brush"
-            self._stroke_points = []
+        elif current_tool == Tool.BRUSH:
+            self._drag.mode = "brush"
+            self._drag.pending_points = array.array("i")
             scaled_point = self._canvas_to_image_coords(start_x, start_y)
             if scaled_point:
                 self.processor.start_drawing()
-                self._stroke_points.append(scaled_point)
+                self._drag.pending_points.extend(scaled_point)
 
     def on_drag_update(self, gesture, offset_x, offset_y):
         # Ensure geometry is calculated before drag updates
-        self._calculate_image_display_geometry()
+        if self._image_display_rect is None:
+            self._calculate_image_display_geometry()
         # Normalize the offsets based on the current scale
         if self._canvas_resize_in_progress:
             self._apply_canvas_resize(offset_x, offset_y)
             return
 
-        if not self._start_point:
+        if not self._drag.start_point:
             # This can happen if drag mode is move_crop_image
-            if self._drag_mode != "move_crop_image":
+            if self._drag.mode != "move_crop_image":
                 return
 
         result = gesture.get_offset()
@@ -522,52 +854,72 @@ class CanvasWidget(Gtk.DrawingArea):
             return
 
         start_x, start_y = (
-            self._start_point if self._start_point else self._drag_start_offset
+            self._drag.start_point
+            if self._drag.start_point
+            else self._drag.start_offset
         )
 
-        if self._drag_mode == "select" or self._drag_mode == "text_create":
+        if self._drag.mode == "select" or self._drag.mode == "text_create":
             x1 = min(start_x, start_x + offset_x)
             y1 = min(start_y, start_y + offset_y)
             x2 = max(start_x, start_x + offset_x)
             y2 = max(start_y, start_y + offset_y)
-            self.selection_box = (x1, y1, x2 - x1, y2 - y1)
-            self.queue_draw()
+            new_box = (x1, y1, x2 - x1, y2 - y1)
+            # Only invalidate when the rubber band actually changed
+            if new_box != self.selection_box:
+                self.selection_box = new_box
+                self.queue_draw()
 
-        elif self._drag_mode == "move":
-            new_widget_x = start_x + offset_x - self._drag_start_offset[0]
-            new_widget_y = start_y + offset_y - self._drag_start_offset[1]
+        elif self._drag.mode == "move":
+            new_widget_x = start_x + offset_x - self._drag.start_offset[0]
+            new_widget_y = start_y + offset_y - self._drag.start_offset[1]
 
             scaled_pos = self._canvas_to_image_coords(new_widget_x, new_widget_y)
-            if scaled_pos:
+            if scaled_pos and scaled_pos != self.processor._floating_selection_position:
                 self.processor.move_floating_selection(scaled_pos[0], scaled_pos[1])
                 self.queue_draw()
 
-        elif self._drag_mode == "move_crop_image":
-            start_pan_x, start_pan_y = self._start_pan_offset
-            drag_start_x, drag_start_y = self._drag_start_offset
+        elif self._drag.mode == "move_crop_image":
+            start_pan_x, start_pan_y = self._drag.start_pan_offset
+            drag_start_x, drag_start_y = self._drag.start_offset
             dx = (drag_start_x + offset_x) - drag_start_x
             dy = (drag_start_y + offset_y) - drag_start_y
 
             if self._image_display_rect:
                 scale = self._image_display_rect[4]
                 if scale > 0:
-                    img_dx = dx / scale
-                    img_dy = dy / scale
-                    self.processor._crop_pan_offset = (
-                        start_pan_x + img_dx,
-                        start_pan_y + img_dy,
-                    )
-                    self.queue_draw()
-
-        elif self._drag_mode == "brush":
+                    pan = self.processor._crop_pan_offset
+                    pan_x = start_pan_x + dx / scale
+                    pan_y = start_pan_y + dy / scale
+                    if pan_x != pan[0] or pan_y != pan[1]:
+                        pan[0] = pan_x
+                        pan[1] = pan_y
+                        self.queue_draw()
+
+        elif self._drag.mode == "brush":
             end_x = start_x + offset_x
             end_y = start_y + offset_y
             scaled_point = self._canvas_to_image_coords(end_x, end_y)
             if scaled_point:
-                self._stroke_points.append(scaled_point)
-                if len(self._stroke_points) > 1:
-                    self.processor.draw_brush_stroke(self._stroke_points[-2:])
-                    self.queue_draw()
+                self._drag.pending_points.extend(scaled_point)
+                # Paint once per frame instead of once per motion event
+                if self._tick_cb_id is None:
+                    self._tick_cb_id = self.add_tick_callback(self._flush_brush)
+
+    def _flush_brush(self, widget, frame_clock):
+        """Tick callback drawing the brush points gathered during the last frame."""
+        self._tick_cb_id = None
+        self._draw_pending_stroke()
+        return GLib.SOURCE_REMOVE
+
+    def _draw_pending_stroke(self):
+        """Draws pending brush points as a single polyline."""
+        points = self._drag.pending_points
+        if len(points) >= 4:
+            self.processor.draw_brush_stroke(list(zip(points[0::2], points[1::2])))
+            # Keep the last point so the next batch connects to this one
+            del points[:-2]
+            self.queue_draw()
 
     def on_drag_end(self, gesture, offset_x, offset_y):
         if self._canvas_resize_in_progress:
@@ -575,20 +927,28 @@ class CanvasWidget(Gtk.DrawingArea):
             self._active_resize_handle = None
             self._resize_start_pointer = None
             self._resize_start_size = None
+            self._last_applied_size = None
             self._update_cursor_for_handle(self._hover_resize_handle)
             return
 
-        if self._drag_mode == "text_create" and self.selection_box:
+        if self._drag.mode == "brush":
+            if self._tick_cb_id is not None:
+                self.remove_tick_callback(self._tick_cb_id)
+                self._tick_cb_id = None
+            self._draw_pending_stroke()
+            self.processor.finish_drawing()
+
+        if self._drag.mode == "text_create" and self.selection_box:
             scaled_selection = self.get_scaled_selection()
             if scaled_selection:
                 # Show text entry at the selected area
                 self.show_text_entry(*scaled_selection)
             self.selection_box = None
-            self._drag_mode = "none"
+            self._drag.mode = "none"
             self.queue_draw()
             return
 
-        if self._drag_mode == "select" and self.selection_box:
+        if self._drag.mode == "select" and self.selection_box:
             scaled_selection = self.get_scaled_selection()
             if scaled_selection and scaled_selection[2] > 0 and scaled_selection[3] > 0:
                 # For select tool, we just define the selection area.
@@ -601,9 +961,9 @@ class CanvasWidget(Gtk.DrawingArea):
 
             self.selection_box = None
 
-        self._drag_mode = "none"
-        self._start_point = None
-        self._stroke_points = []
+        self._drag.mode = "none"
+        self._drag.start_point = None
+        self._drag.pending_points = array.array("i")
         self.queue_draw()
 
     def get_scaled_selection(self):
@@ -647,22 +1007,14 @@ class CanvasWidget(Gtk.DrawingArea):
         scale = self._image_display_rect[4]
         if scale == 0:
             return
-        dx = offset_x / scale
-        dy = offset_y / scale
+        sx, sy = self._HANDLE_SIGNS[self._active_resize_handle]
         width, height = self._resize_start_size
-        handle = self._active_resize_handle
-        new_width = width
-        new_height = height
-        if handle in ("left", "top-left", "bottom-left"):
-            new_width -= dx
-        elif handle in ("right", "top-right", "bottom-right"):
-            new_width += dx
-        if handle in ("top", "top-left", "top-right"):
-            new_height -= dy
-        elif handle in ("bottom", "bottom-left", "bottom-right"):
-            new_height += dy
-        new_width = max(1, int(round(new_width)))
-        new_height = max(1, int(round(new_height)))
+        new_width = max(1, _iround(width + sx * offset_x / scale))
+        new_height = max(1, _iround(height + sy * offset_y / scale))
+        # Pointer moves that round to the same size need no new surface
+        if (new_width, new_height) == self._last_applied_size:
+            return
+        self._last_applied_size = (new_width, new_height)
         self.processor.resize_canvas(new_width, new_height, anchor=self._resize_anchor)
         self.queue_draw()
 
@@ -696,11 +1048,11 @@ class CanvasWidget(Gtk.DrawingArea):
                 self.queue_draw()
             return
 
-        if self.manager.current_tool == "text":
+        if self.manager.current_tool == Tool.TEXT:
             if self._text_entry:
                 self._finalize_text_entry()
             gesture.set_state(Gtk.EventSequenceState.CLAIMED)
-        elif self.manager.current_tool == "brush":
+        elif self.manager.current_tool == Tool.BRUSH:
             self.processor.draw_brush_dab(image_point)
             self.queue_draw()
 
@@ -725,7 +1077,7 @@ class CanvasWidget(Gtk.DrawingArea):
             self.processor.current_image.get_height(),
         )
         if 0 <= img_x < img_w and 0 <= img_y < img_h:
-            return (int(round(img_x)), int(round(img_y)))
+            return (_iround(img_x), _iround(img_y))
         return None
 
     def _image_to_canvas_coords(self, img_x, img_y):
@@ -742,138 +1094,101 @@ class CanvasWidget(Gtk.DrawingArea):
 
     def _image_box_to_canvas_rect(self, x1, y1, x2, y2):
         """Convert image-space box to canvas rect (x, y, w, h)."""
-        p1 = self._image_to_canvas_coords(x1, y1)
-        p2 = self._image_to_canvas_coords(x2, y2)
-        if not p1 or not p2:
-            return None
-        return (p1[0], p1[1], p2[0] - p1[0], p2[1] - p1[1])
-
-    def _hit_test_resize_handle(self, x, y):
-        if not self._image_display_rect:
+        geom = self._calculate_image_display_geometry()
+        if not geom:
             return None
-        img_x, img_y, img_w, img_h, _ = self._image_display_rect
-        if img_w <= 0 or img_h <= 0:
+        draw_x, draw_y, _, _, scale = geom
+        if scale == 0:
             return None
-        margin = self.RESIZE_HANDLE_MARGIN
-        x_min, x_max = img_x, img_x + img_w
-        y_min, y_max = img_y, img_y + img_h
-
-        on_left = abs(x - x_min) <= margin
-        on_right = abs(x - x_max) <= margin
-        on_top = abs(y - y_min) <= margin
-        on_bottom = abs(y - y_max) <= margin
-
-        if on_top:
-            if on_left:
-                return "top-left"
-            if on_right:
-                return "top-right"
-            return "top"
-        if on_bottom:
-            if on_left:
-                return "bottom-left"
-            if on_right:
-                return "bottom-right"
-            return "bottom"
-        if on_left:
-            return "left"
-        if on_right:
-            return "right"
+        return (
+            draw_x + x1 * scale,
+            draw_y + y1 * scale,
+            (x2 - x1) * scale,
+            (y2 - y1) * scale,
+        )
 
+    def _hit_test_resize_handle(self, x, y):
+        for name, x1, x2, y1, y2 in self._handle_rects:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return name
         return None
 
     def _anchor_for_handle(self, handle):
-        mapping = {
-            "top-left": ("right", "bottom"),
-            "top": ("left", "bottom"),
-            "top-right": ("left", "bottom"),
-            "right": ("left", "top"),
-            "bottom-right": ("left", "top"),
-            "bottom": ("left", "top"),
-            "bottom-left": ("right", "top"),
-            "left": ("right", "top"),
-        }
-        return mapping.get(handle, ("left", "top"))
+        return self._HANDLE_ANCHORS.get(handle, ("left", "top"))
 
     def _update_cursor_for_handle(self, handle):
         display = self.get_display()
         if not display:
             return
-        cursor_name = None
-        if handle in ("top-left", "bottom-right"):
-            cursor_name = "nwse-resize"
-        elif handle in ("top-right", "bottom-left"):
-            cursor_name = "nesw-resize"
-        elif handle in ("left", "right"):
-            cursor_name = "ew-resize"
-        elif handle in ("top", "bottom"):
-            cursor_name = "ns-resize"
-        cursor = Gdk.Cursor.new_from_name(cursor_name) if cursor_name else None
-        self.set_cursor(cursor)
+        self._set_cursor_name(HANDLE_TO_CURSOR.get(handle))
 
-    def _draw_resize_handles(self, cr):
-        """Draws the canvas resize handles using Cairo."""
-        if not self._image_display_rect or not self.processor.current_image:
+    def _set_cursor_name(self, name):
+        """Shows the named cursor (None for default), skipping unchanged updates."""
+        if name == self._current_cursor_name:
             return
+        self._current_cursor_name = name
+        cursor = None
+        if name:
+            cursor = self._CURSOR_CACHE.get(name)
+            if cursor is None:
+                cursor = Gdk.Cursor.new_from_name(name)
+                self._CURSOR_CACHE[name] = cursor
+        self.set_cursor(cursor)
 
-        size = self.RESIZE_HANDLE_SIZE
-        x, y, w, h, _ = self._image_display_rect
+    def _snapshot_resize_handles(self, snapshot):
+        """Appends the canvas border and resize handles.
 
-        # Define handle centers
-        centers = [
-            (x, y),
-            (x + w / 2, y),
-            (x + w, y),
-            (x, y + h / 2),
-            (x + w, y + h / 2),
-            (x, y + h),
-            (x + w / 2, y + h),
-            (x + w, y + h),
-        ]
+        They are recorded once into a render node per display rect and that
+        node is replayed on later frames.
+        """
+        x, y, w, h, _ = self._image_display_rect
+        rect = (x, y, w, h)
+        if rect != self._handles_node_rect:
+            self._handles_node_rect = rect
+            self._handles_node = self._build_handles_node(x, y, w, h)
+        snapshot.append_node(self._handles_node)
+
+    def _build_handles_node(self, x, y, w, h):
+        """Records the canvas border and the eight handles into one node."""
+        size = self.RESIZE_HANDLE_SIZE
+        half = size / 2
+        recorder = Gtk.Snapshot()
 
         # Draw a thin border around the image canvas
-        cr.save()
-        cr.set_source_rgba(0.0, 0.0, 0.0, 0.3)
-        cr.set_line_width(1)
-        cr.rectangle(x, y, w, h)
-        cr.stroke()
-
-        # Draw handles (with a slight shadow for visibility)
-        for cx, cy in centers:
-            # Shadow
-            cr.set_source_rgba(0.1, 0.1, 0.1, 0.5)
-            cr.rectangle(cx - size / 2 + 1, cy - size / 2 + 1, size, size)
-            cr.fill()
-            # Fill
-            cr.set_source_rgba(1.0, 1.0, 1.0, 0.9)
-            cr.rectangle(cx - size / 2, cy - size / 2, size, size)
-            cr.fill()
-            # Border
-            cr.set_source_rgba(0.1, 0.1, 0.1, 0.8)
-            cr.set_line_width(1)
-            cr.rectangle(cx - size / 2, cy - size / 2, size, size)
-            cr.stroke()
-        cr.restore()
+        recorder.append_border(
+            Gsk.RoundedRect().init_from_rect(Graphene.Rect().init(x, y, w, h), 0),
+            [1, 1, 1, 1],
+            [_CANVAS_BORDER_RGBA] * 4,
+        )
+
+        # Draw handles (with a slight shadow for visibility); the border is
+        # the fill square painted over a slightly smaller inner square
+        for fx, fy in self._HANDLE_OFFSETS:
+            hx = x + fx * w - half
+            hy = y + fy * h - half
+            recorder.append_color(
+                _HANDLE_SHADOW_RGBA, Graphene.Rect().init(hx + 1, hy + 1, size, size)
+            )
+            recorder.append_color(
+                _HANDLE_BORDER_RGBA, Graphene.Rect().init(hx, hy, size, size)
+            )
+            recorder.append_color(
+                _HANDLE_FILL_RGBA,
+                Graphene.Rect().init(hx + 1, hy + 1, size - 2, size - 2),
+            )
+        return recorder.to_node()
 
     def _apply_text_entry_style(self, color, font_size=20.0):
         """Apply CSS style with the given color to the text entry."""
         if not self._text_entry:
             return
 
-        context = self._text_entry.get_style_context()
-
-        # Remove old provider if we stored it (we didn't store it per instance before,
-        # but we should probably manage it better. For now, adding a new one with
-        # APPLICATION priority overrides the old one if we keep adding them?
-        # No, we should remove the old one.
-        # But Gtk.StyleContext.add_provider_for_display adds it globally for the display?
-        # Wait, the previous code used add_provider_for_display. That affects ALL widgets.
-        # We should use add_provider (for context) for this specific widget.
-
-        provider = _create_text_css_provider(color, font_size)
-        context.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-
-        self._text_entry.add_css_class("canvas-text-overlay")
+        css = _text_css(color, font_size)
+        # Size-only ticks for other tools and repeated colors produce the
+        # same stylesheet; do not make GTK re-parse it
+        if css != self._text_css:
+            self._text_css = css
+            self._text_css_provider.load_from_data(css)
 
     def update_text_color(self, color):
         """Update the color of the active text entry."""
@@ -898,8 +1213,8 @@ class CanvasWidget(Gtk.DrawingArea):
 
     def _on_text_entry_key_press(self, controller, keyval, keycode, state):
         """Finalize text when Enter is pressed without modifiers."""
-        if keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            if state & (Gdk.ModifierType.SHIFT_MASK | Gdk.ModifierType.CONTROL_MASK):
+        if keyval == _KEY_RET or keyval == _KEY_KPRET:
+            if state & _SHIFT_OR_CTRL:
                 return False
             self._finalize_text_entry()
             return True
@@ -916,33 +1231,31 @@ class CanvasWidget(Gtk.DrawingArea):
             return
 
         buffer = self._text_entry.get_buffer()
-        # text = buffer.get_text(start_iter, end_iter, True).strip()
-        text = buffer.props.text.strip()
+        text = ""
+        if buffer.get_char_count():
+            text = buffer.get_text(
+                buffer.get_start_iter(), buffer.get_end_iter(), False
+            )
 
-        if text:
+        if text and not text.isspace():
+            text = text.strip()
             x, y = self._text_entry_pos or (0, 0)
             # Add text to the image (ImageProcessor does the drawing in image coords)
             self.processor.add_text(text, x, y)
-            self.queue_draw()
+            self.request_redraw()
 
-        # Remove and cleanup the GTK entry overlay
-        if self._overlay and self._text_entry:
-            try:
-                self._overlay.remove_overlay(self._text_entry)
-            except (AttributeError, TypeError):
-                # Handle cases where overlay or text entry is invalid
-                pass
-
-        self._text_entry = None
-        self._text_entry_pos = None
-        self._text_entry_initial_dims = None
+        self._cleanup_text_overlay()
 
     def hide_text_entry(self) -> None:
         """Hides and removes the text entry overlay without committing text."""
         if not self._text_entry:
             return
         # Remove the overlay without adding text to the image
-        if self._overlay and self._text_entry:
+        self._cleanup_text_overlay()
+
+    def _cleanup_text_overlay(self) -> None:
+        """Removes the GTK entry overlay and forgets the entry state."""
+        if self._overlay:
             try:
                 self._overlay.remove_overlay(self._text_entry)
             except (AttributeError, TypeError):
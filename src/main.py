@@ -4,14 +4,20 @@ This module defines the main GTK application class and entry point for the
 image editing application.
 """
 
+import logging
+import os
 import sys
+
+# The canvas is one large texture redrawn every frame; pick the NGL renderer
+# before GTK opens the display, unless the user already chose one
+os.environ.setdefault("GSK_RENDERER", "ngl")
+
 import gi  # noqa: E402
 
 gi.require_version("Gtk", "4.0")
-gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import Gtk, Gio  # noqa: E402
+from gi.repository import Gtk, Gdk, Gio  # noqa: E402
 
-from .window import MainWindow  # noqa: E402
+from .window import MainWindow, install_app_stylesheet  # noqa: E402
 
 
 def on_activate(app):
@@ -20,14 +26,18 @@ def on_activate(app):
     Args:
         app: The GTK application instance.
     """
+    install_app_stylesheet(Gdk.Display.get_default())
+
+    # Request the dark variant before any widget exists, so flipping the
+    # setting does not restyle an already built window tree
+    settings = Gtk.Settings.get_default()
+    if not settings.get_property("gtk-application-prefer-dark-theme"):
+        settings.set_property("gtk-application-prefer-dark-theme", True)
+
     # Create the window inside the activate callback
     # Ensure MainWindow accepts the application argument
     win = MainWindow(application=app)
 
-    # Request the system's preferred color scheme
-    settings = Gtk.Settings.get_default()
-    settings.set_property("gtk-application-prefer-dark-theme", True)
-
     win.present()
 
 
@@ -37,6 +47,8 @@ def main() -> int:
     Returns:
         Exit status code.
     """
+    logging.basicConfig(level=logging.WARNING)
+
     # Ensure application_id matches the Flatpak ID
     app = Gtk.Application(
         application_id="com.github.konverner.gnome-nano-image-edit",
@@ -4,10 +4,24 @@ This module manages the state of editing tools and validates tool selection.
 """
 
 import logging
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
 
+class Tool(IntEnum):
+    """The editing tools, stored as small ints for cheap comparisons."""
+
+    SELECT = 0
+    CROP = 1
+    TEXT = 2
+    BRUSH = 3
+    MOVE = 4
+
+
+_NAME_TO_TOOL = {tool.name.lower(): tool for tool in Tool}
+
+
 class ToolManager:
     """Manages the state of the editing tools.
 
@@ -15,29 +29,36 @@ class ToolManager:
     for tool selection.
     """
 
-    VALID_TOOLS = frozenset(["select", "crop", "text", "brush", "move"])
-
     def __init__(self) -> None:
         """Initializes the tool manager with the default tool."""
-        self._current_tool = "select"  # Default tool
+        self._current_tool = Tool.SELECT  # Default tool
 
     @property
-    def current_tool(self) -> str:
+    def current_tool(self) -> Tool:
         """Gets the current tool.
 
         Returns:
-            The name of the currently active tool.
+            The currently active tool.
         """
         return self._current_tool
 
     @current_tool.setter
-    def current_tool(self, tool_name: str) -> None:
+    def current_tool(self, tool) -> None:
         """Sets the current tool.
 
         Args:
-            tool_name: The name of the tool to activate.
+            tool: The Tool to activate, or its lowercase name.
         """
-        if tool_name in self.VALID_TOOLS:
-            self._current_tool = tool_name
+        if isinstance(tool, Tool):
+            self._current_tool = tool
+            return
+        resolved = _NAME_TO_TOOL.get(tool)
+        if resolved is None:
+            logger.warning("Unknown tool '%s'", tool)
         else:
-            logger.warning("Unknown tool '%s'", tool_name)
+            self._current_tool = resolved
+
+    @property
+    def current_tool_name(self) -> str:
+        """Gets the lowercase name of the current tool, e.g. "brush"."""
+        return self._current_tool.name.lower()
@@ -4,14 +4,103 @@ This module handles all image data manipulation using Cairo surfaces,
 including loading, saving, editing operations, and undo/redo functionality.
 """
 
-import io
+import contextlib
+import functools
 import math
+import zlib
+from collections import deque
+from dataclasses import dataclass
 
 import cairo
 import gi
 
+gi.require_version("Gdk", "4.0")
 gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import GdkPixbuf  # noqa: E402
+gi.require_version("Pango", "1.0")
+gi.require_version("PangoCairo", "1.0")
+from gi.repository import Gdk, GdkPixbuf, Pango, PangoCairo  # noqa: E402
+
+
+_INV_255 = 1.0 / 255.0
+
+
+def _normalize_rgba(color: tuple) -> tuple:
+    """Converts a 0-255 RGBA tuple to the 0-1 floats Cairo expects."""
+    r, g, b, a = color
+    return (r * _INV_255, g * _INV_255, b * _INV_255, a * _INV_255)
+
+
+# Share of a canvas size change placed before the old content, in halves:
+# 0 keeps that edge fixed, 2 moves it by the full delta, 1 centers
+_ANCHOR_HALVES = {
+    (x_name, y_name): (x_halves, y_halves)
+    for x_name, x_halves in (("left", 0), ("center", 1), ("right", 2))
+    for y_name, y_halves in (("top", 0), ("center", 1), ("bottom", 2))
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _build_brush_stamp(size: int, color: tuple) -> tuple:
+    """Renders one brush dab for a (size, color) pair.
+
+    The stamp holds one filled circle in the brush color on a transparent
+    background. Stamps are memoized, so switching between a handful of
+    brushes during a session reuses the already rendered surfaces. The
+    center offset is a whole number, so dabs at integer points land on the
+    pixel grid exactly like a directly filled arc.
+
+    Args:
+        size: Brush diameter in pixels.
+        color: RGBA color tuple (0-255).
+
+    Returns:
+        A (surface, center) tuple; paint the surface at point - center.
+    """
+    radius = size / 2.0
+    center = math.ceil(radius) + 1
+    stamp = cairo.ImageSurface(cairo.FORMAT_ARGB32, 2 * center, 2 * center)
+    ctx = cairo.Context(stamp)
+    ctx.set_source_rgba(*_normalize_rgba(color))
+    ctx.arc(center, center, radius, 0, 2 * math.pi)
+    ctx.fill()
+    stamp.flush()
+    return stamp, center
+
+
+@contextlib.contextmanager
+def _edit_pixels(surface: cairo.ImageSurface, x: int, y: int, w: int, h: int):
+    """Gives direct write access to a surface's pixel buffer.
+
+    The surface is flushed once on entry and only the edited rectangle is
+    marked dirty on exit, so Cairo neither re-validates the whole surface
+    nor misses the change.
+
+    Args:
+        surface: The image surface to edit.
+        x: Left edge of the edited rectangle.
+        y: Top edge of the edited rectangle.
+        w: Width of the edited rectangle.
+        h: Height of the edited rectangle.
+
+    Yields:
+        A (data, stride) tuple with the writable buffer and its row stride.
+    """
+    surface.flush()
+    try:
+        yield surface.get_data(), surface.get_stride()
+    finally:
+        surface.mark_dirty_rectangle(x, y, w, h)
+
+
+@dataclass(frozen=True, slots=True)
+class _UndoPatch:
+    """A zlib-compressed copy of one rectangle of the working surface."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    data: bytes
 
 
 class ImageProcessor:
@@ -23,7 +112,6 @@ class ImageProcessor:
 
     def __init__(self) -> None:
         """Initializes the image processor with default state."""
-        self._original_surface = None
         self._current_surface = None
         self._floating_selection_data = None
         self._selection_box = None
@@ -31,15 +119,61 @@ class ImageProcessor:
         self._brush_size = 10
         self._text_size = 20
         self._brush_color = (255, 0, 0, 255)
+        self._brush_rgba = _normalize_rgba(self._brush_color)  # Cairo 0-1 floats
         self._font_path = None
+        self._font_description = None  # Pango description, built on first use
         self.image_path = None
 
-        self._undo_stack = []
-        self._redo_stack = []
+        # Entries are full surfaces (size changes, selections) or _UndoPatch
+        # regions (brush, text) restored in place. The bounded deques drop
+        # the oldest entry on append in O(1).
         self._max_undo_steps = 20
+        self._undo_stack = deque(maxlen=self._max_undo_steps)
+        self._redo_stack = deque(maxlen=self._max_undo_steps)
+        # Pre-stroke snapshot and touched area, turned into a patch on finish
+        self._stroke_before = None
+        self._stroke_bbox = None
 
         self._is_cropping = False
-        self._crop_pan_offset = (0, 0)
+        # Two-slot [x, y] list, updated in place while the crop image is dragged
+        self._crop_pan_offset = [0.0, 0.0]
+
+        # Incremented on every change visible through current_image
+        self._revision = 0
+        self._surface_replaced_callbacks = []
+
+        # Working surface with the floating selection drawn on top, reused
+        # while the revision it was built for is current
+        self._composite_cache = None
+        self._composite_revision = None
+
+    @property
+    def revision(self) -> int:
+        """Returns a counter that changes whenever current_image changes.
+
+        Returns:
+            The current image revision.
+        """
+        return self._revision
+
+    def _mark_changed(self) -> None:
+        """Records that the visible image content changed."""
+        self._revision += 1
+        self._composite_cache = None
+
+    def connect_surface_replaced(self, callback) -> None:
+        """Registers a callback invoked whenever the working surface is replaced.
+
+        Args:
+            callback: Callable taking no arguments.
+        """
+        self._surface_replaced_callbacks.append(callback)
+
+    def _notify_surface_replaced(self) -> None:
+        """Informs listeners that the working surface may have changed size."""
+        self._mark_changed()
+        for callback in self._surface_replaced_callbacks:
+            callback()
 
     def create_blank_image(
         self, width: int = 800, height: int = 600, color: tuple = (255, 255, 255, 255)
@@ -53,20 +187,25 @@ class ImageProcessor:
         """
         self.clear_floating_selection()
 
+        # New image surfaces start out transparent black, so only other
+        # colors need a fill
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
-        ctx = cairo.Context(surface)
-
-        # Cairo uses normalized color values (0-1)
-        r, g, b, a = [c / 255.0 for c in color]
-        ctx.set_source_rgba(r, g, b, a)
-        ctx.paint()
+        if color[3]:
+            ctx = cairo.Context(surface)
+            # Cairo uses normalized color values (0-1)
+            r, g, b, a = _normalize_rgba(color)
+            ctx.set_source_rgba(r, g, b, a)
+            ctx.set_operator(cairo.OPERATOR_SOURCE)
+            ctx.paint()
 
-        self._original_surface = surface
-        self._current_surface = self._copy_surface(surface)
+        # The fresh surface is not shared, so it becomes the working surface
+        self._current_surface = surface
 
         self.image_path = None
-        self._undo_stack = []
-        self._redo_stack = []
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._stroke_before = None
+        self._notify_surface_replaced()
 
     def _copy_surface(self, surface: cairo.Surface) -> cairo.Surface:
         """Creates a deep copy of a Cairo surface.
@@ -80,12 +219,14 @@ class ImageProcessor:
         if not surface:
             return None
 
+        # Same format and size give the same stride, so the pixels can be
+        # copied as one block instead of being composited with paint()
+        surface.flush()
         new_surface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, surface.get_width(), surface.get_height()
+            surface.get_format(), surface.get_width(), surface.get_height()
         )
-        ctx = cairo.Context(new_surface)
-        ctx.set_source_surface(surface)
-        ctx.paint()
+        new_surface.get_data()[:] = surface.get_data()
+        new_surface.mark_dirty()
         return new_surface
 
     def load_image(self, filepath: str) -> None:
@@ -97,39 +238,70 @@ class ImageProcessor:
         Raises:
             Exception: If the file cannot be loaded or processed.
         """
-        self.clear_floating_selection()
+        self.install_image(self.decode_image(filepath), filepath)
+
+    @staticmethod
+    def decode_image(filepath: str) -> cairo.ImageSurface:
+        """Decodes an image file into a new ARGB32 surface.
 
+        Touches no processor state, so it may run on a worker thread while
+        the main loop keeps handling input; hand the result to
+        install_image() on the main thread.
+
+        Args:
+            filepath: Path to the image file to decode.
+
+        Returns:
+            The decoded image surface.
+
+        Raises:
+            Exception: If the file cannot be loaded or processed.
+        """
         # Use GdkPixbuf to load the image, which supports many formats (JPEG, GIF, etc.)
         pixbuf = GdkPixbuf.Pixbuf.new_from_file(filepath)
+        # Honor EXIF orientation; returns the same pixbuf when there is none
+        pixbuf = pixbuf.apply_embedded_orientation() or pixbuf
 
-        # To get this into a Cairo surface, we can save it as a PNG to a memory buffer
-        # and then load it into Cairo from that buffer.
-        success, buffer = pixbuf.save_to_bufferv("png", [], [])
-        if not success:
-            raise Exception("Failed to convert image to PNG buffer.")
-
-        # Create a file-like object from the buffer
-        png_buffer = io.BytesIO(buffer)
+        # Paint the pixbuf straight into an ARGB32 surface; GDK converts the
+        # RGB(A) rows to premultiplied native-endian pixels in a single pass
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, pixbuf.get_width(), pixbuf.get_height()
+        )
+        ctx = cairo.Context(surface)
+        ctx.set_operator(cairo.OPERATOR_SOURCE)
+        Gdk.cairo_set_source_pixbuf(ctx, pixbuf, 0, 0)
+        ctx.paint()
+        surface.flush()
+        return surface
 
-        # Load into a Cairo surface
-        surface = cairo.ImageSurface.create_from_png(png_buffer)
+    def install_image(self, surface: cairo.ImageSurface, filepath: str) -> None:
+        """Makes a decoded surface the working image and resets the history.
 
-        # Ensure the surface is in ARGB32 format for consistency
-        if surface.get_format() != cairo.FORMAT_ARGB32:
-            new_surface = cairo.ImageSurface(
-                cairo.FORMAT_ARGB32, surface.get_width(), surface.get_height()
-            )
-            ctx = cairo.Context(new_surface)
-            ctx.set_source_surface(surface)
-            ctx.paint()
-            surface = new_surface
+        Args:
+            surface: Surface returned by decode_image(); it is used directly.
+            filepath: Path the surface was decoded from.
+        """
+        self.clear_floating_selection()
 
-        self._original_surface = surface
-        self._current_surface = self._copy_surface(surface)
+        # The decoded surface is not shared, so it becomes the working surface
+        self._current_surface = surface
 
         self.image_path = filepath
-        self._undo_stack = []
-        self._redo_stack = []
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._stroke_before = None
+        self._notify_surface_replaced()
+
+    @property
+    def image_size(self) -> tuple:
+        """Returns the size of the working surface without compositing.
+
+        Returns:
+            A (width, height) tuple, or None if there is no image.
+        """
+        if not self._current_surface:
+            return None
+        return (self._current_surface.get_width(), self._current_surface.get_height())
 
     @property
     def current_image(self) -> cairo.Surface:
@@ -139,39 +311,107 @@ class ImageProcessor:
             The current Cairo surface, with floating selection if present.
         """
         if self._floating_selection_data:
+            # Every edit bumps the revision, so an equal revision means the
+            # composite built last time is still accurate
+            if self._composite_revision == self._revision:
+                return self._composite_cache
             # Create a temporary composite to show the floating selection being moved
             temp_surface = self._copy_surface(self._current_surface)
-            ctx = cairo.Context(temp_surface)
-            ctx.set_source_surface(
-                self._floating_selection_data,
-                self._floating_selection_position[0],
-                self._floating_selection_position[1],
-            )
-            ctx.paint()
+            self._paint_floating_selection(temp_surface)
+            self._composite_cache = temp_surface
+            self._composite_revision = self._revision
             return temp_surface
         return self._current_surface
 
-    def save_state(self) -> None:
+    def save_state(self, dirty_rect: tuple = None) -> None:
         """Saves the current state to the undo stack.
 
         Limits the undo stack to max_undo_steps entries and clears the redo stack.
+
+        Args:
+            dirty_rect: Optional (x, y, w, h) bounding every pixel the coming
+                edit may touch. Only that region is stored, compressed;
+                without it the whole surface is copied.
         """
+        self.finish_drawing()
         if self._current_surface:
-            self._undo_stack.append(self._copy_surface(self._current_surface))
-            if len(self._undo_stack) > self._max_undo_steps:
-                self._undo_stack.pop(0)
+            if dirty_rect is None:
+                entry = self._copy_surface(self._current_surface)
+            else:
+                entry = self._capture_patch(self._current_surface, dirty_rect)
+            self._push_undo(entry)
             self._redo_stack.clear()
 
+    def _push_undo(self, entry) -> None:
+        self._undo_stack.append(entry)
+
+    def _capture_patch(self, surface: cairo.ImageSurface, rect: tuple) -> _UndoPatch:
+        """Compresses the pixels of a rectangle of a surface.
+
+        Args:
+            surface: The ARGB32 surface to read from.
+            rect: (x, y, w, h) region; it is clipped to the surface bounds.
+
+        Returns:
+            The patch holding the region's pixels.
+        """
+        x, y, w, h = rect
+        x0 = max(0, int(math.floor(x)))
+        y0 = max(0, int(math.floor(y)))
+        x1 = min(surface.get_width(), int(math.ceil(x + w)))
+        y1 = min(surface.get_height(), int(math.ceil(y + h)))
+        if x1 <= x0 or y1 <= y0:
+            return _UndoPatch(0, 0, 0, 0, b"")
+
+        surface.flush()
+        data = surface.get_data()
+        stride = surface.get_stride()
+        start = x0 * 4
+        end = x1 * 4
+        rows = b"".join(
+            data[row * stride + start : row * stride + end] for row in range(y0, y1)
+        )
+        return _UndoPatch(x0, y0, x1 - x0, y1 - y0, zlib.compress(rows, 1))
+
+    def _apply_patch(self, patch: _UndoPatch) -> None:
+        """Writes a patch back into the working surface."""
+        if not patch.width:
+            return
+        rows = zlib.decompress(patch.data)
+        row_len = patch.width * 4
+        start = patch.x * 4
+        with _edit_pixels(
+            self._current_surface, patch.x, patch.y, patch.width, patch.height
+        ) as (data, stride):
+            for i in range(patch.height):
+                offset = (patch.y + i) * stride + start
+                data[offset : offset + row_len] = rows[i * row_len : (i + 1) * row_len]
+
+    def _swap_history(self, source: deque, target: deque) -> None:
+        """Restores the top entry of source, pushing the current state to target."""
+        entry = source.pop()
+        if isinstance(entry, _UndoPatch):
+            target.append(
+                self._capture_patch(
+                    self._current_surface, (entry.x, entry.y, entry.width, entry.height)
+                )
+            )
+            self._apply_patch(entry)
+        else:
+            target.append(self._copy_surface(self._current_surface))
+            self._current_surface = entry
+
     def undo(self) -> bool:
         """Restores the previous state from the undo stack.
 
         Returns:
             True if undo was successful, False if undo stack is empty.
         """
+        self.finish_drawing()
         if self._undo_stack:
-            self._redo_stack.append(self._copy_surface(self._current_surface))
-            self._current_surface = self._undo_stack.pop()
+            self._swap_history(self._undo_stack, self._redo_stack)
             self.clear_floating_selection()
+            self._notify_surface_replaced()
             return True
         return False
 
@@ -181,22 +421,23 @@ class ImageProcessor:
         Returns:
             True if redo was successful, False if redo stack is empty.
         """
+        self.finish_drawing()
         if self._redo_stack:
-            self._undo_stack.append(self._copy_surface(self._current_surface))
-            self._current_surface = self._redo_stack.pop()
+            self._swap_history(self._redo_stack, self._undo_stack)
             self.clear_floating_selection()
+            self._notify_surface_replaced()
             return True
         return False
 
     def start_crop(self):
         self.paste_selection()  # Finalize any floating selection
         self._is_cropping = True
-        self._crop_pan_offset = (0, 0)  # Reset pan
+        self._crop_pan_offset[:] = (0.0, 0.0)  # Reset pan
 
     def cancel_crop(self):
         self._is_cropping = False
         self._selection_box = None
-        self._crop_pan_offset = (0, 0)
+        self._crop_pan_offset[:] = (0.0, 0.0)
 
     def apply_crop(self) -> None:
         """Crops the image to the selection_box."""
@@ -206,14 +447,14 @@ class ImageProcessor:
             pan_x, pan_y = self._crop_pan_offset
 
             new_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, int(w), int(h))
-            ctx = cairo.Context(new_surface)
-
-            # Set the source to the relevant part of the old surface
-            ctx.set_source_surface(self._current_surface, -x + pan_x, -y + pan_y)
-            ctx.paint()
+            # Copy the relevant part of the old surface
+            self._blit_rect(
+                new_surface, self._current_surface, x - pan_x, y - pan_y, w, h, 0, 0
+            )
 
             self._current_surface = new_surface
             self.cancel_crop()
+            self._notify_surface_replaced()
 
     def cut_selection(self, selection_box):
         """Cuts the selected area and stores it as a Cairo surface."""
@@ -229,15 +470,13 @@ class ImageProcessor:
             self._floating_selection_data = cairo.ImageSurface(
                 cairo.FORMAT_ARGB32, w, h
             )
-            cut_ctx = cairo.Context(self._floating_selection_data)
-            cut_ctx.set_source_surface(self._current_surface, -x, -y)
-            cut_ctx.paint()
+            self._blit_rect(
+                self._floating_selection_data, self._current_surface, x, y, w, h, 0, 0
+            )
 
             # Fill the area on the main surface with transparent pixels
-            main_ctx = cairo.Context(self._current_surface)
-            main_ctx.rectangle(x, y, w, h)
-            main_ctx.set_operator(cairo.OPERATOR_CLEAR)
-            main_ctx.fill()
+            self._clear_rect(self._current_surface, x, y, w, h)
+            self._mark_changed()
 
     def copy_selection(self, selection_box: tuple) -> cairo.Surface:
         """Copies the selected area as a new Cairo surface without removing it."""
@@ -248,9 +487,7 @@ class ImageProcessor:
 
             # Create a new surface for the copied data
             copied_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
-            ctx = cairo.Context(copied_surface)
-            ctx.set_source_surface(self._current_surface, -x, -y)
-            ctx.paint()
+            self._blit_rect(copied_surface, self._current_surface, x, y, w, h, 0, 0)
 
             return copied_surface
         return None
@@ -263,17 +500,13 @@ class ImageProcessor:
         self.save_state()  # Save state before adding new floating selection
         self._floating_selection_data = surface
         self._floating_selection_position = (x, y)
+        self._mark_changed()
 
     def paste_selection(self):
         """Pastes the floating selection (a Cairo surface) at its current position."""
         if self._current_surface and self._floating_selection_data:
-            ctx = cairo.Context(self._current_surface)
-            x, y = self._floating_selection_position
-
-            # By default, set_source_surface uses OPERATOR_OVER, which respects alpha
-            ctx.set_source_surface(self._floating_selection_data, x, y)
-            ctx.paint()
-
+            # The default OPERATOR_OVER respects the selection's alpha
+            self._paint_floating_selection(self._current_surface)
             self.clear_floating_selection()
 
     def clear_floating_selection(self):
@@ -281,29 +514,92 @@ class ImageProcessor:
         self._floating_selection_data = None
         self._selection_box = None
         self._floating_selection_position = None
+        self._mark_changed()
 
     def move_floating_selection(self, x: int, y: int) -> None:
-        """Updates the position of the floating selection."""
+        """Updates the position of the floating selection.
+
+        A composite that is still current is patched in place: the area the
+        selection leaves is restored from the working surface and the
+        selection is painted at its new position, so a drag costs two
+        selection-sized blits per step instead of a full-image copy.
+        """
         if self._floating_selection_data:
+            if self._composite_revision == self._revision:
+                composite = self._composite_cache
+            else:
+                composite = None
+            old_x, old_y = self._floating_selection_position
             self._floating_selection_position = (x, y)
+            self._mark_changed()
+            if composite is not None:
+                self._blit_rect(
+                    composite,
+                    self._current_surface,
+                    old_x,
+                    old_y,
+                    self._floating_selection_data.get_width(),
+                    self._floating_selection_data.get_height(),
+                    old_x,
+                    old_y,
+                )
+                self._paint_floating_selection(composite)
+                self._composite_cache = composite
+                self._composite_revision = self._revision
+
+    def _paint_floating_selection(self, surface: cairo.ImageSurface) -> None:
+        """Composites the floating selection over a surface at its position."""
+        x, y = self._floating_selection_position
+        floating = self._floating_selection_data
+        ctx = cairo.Context(surface)
+        ctx.set_source_surface(floating, x, y)
+        # Clipping to the selection keeps pixman to its rectangle
+        ctx.rectangle(x, y, floating.get_width(), floating.get_height())
+        ctx.fill()
 
     def set_brush_size(self, size: int) -> None:
         """Sets the brush diameter."""
         self.paste_selection()
         self._brush_size = size
+        # Render the stamp now rather than on the first dab of the next stroke
+        self._get_brush_stamp()
 
     def set_brush_color(self, color: tuple) -> None:
         """Sets the brush color."""
         self.paste_selection()
         self._brush_color = color
+        self._brush_rgba = _normalize_rgba(color)
+        self._get_brush_stamp()
 
     def set_text_size(self, size: int) -> None:
         """Sets the text font size."""
         self._text_size = size
+        self._font_description = None
 
     def start_drawing(self):
-        """Prepares for a new drawing operation by saving state."""
-        self.save_state()
+        """Prepares for a new drawing operation by saving state.
+
+        The undo entry is only recorded by finish_drawing(), once the area the
+        stroke covered is known.
+        """
+        self.finish_drawing()
+        if self._current_surface:
+            self._stroke_before = self._copy_surface(self._current_surface)
+            self._stroke_bbox = None
+            self._redo_stack.clear()
+
+    def finish_drawing(self) -> None:
+        """Records the undo patch for the stroke begun by start_drawing()."""
+        before = self._stroke_before
+        if before is None:
+            return
+        self._stroke_before = None
+        bbox = self._stroke_bbox or (0, 0, 0, 0)
+        self._stroke_bbox = None
+        if (before.get_width(), before.get_height()) == self.image_size:
+            self._push_undo(self._capture_patch(before, bbox))
+        else:
+            self._push_undo(before)
 
     def draw_brush_stroke(self, points: list) -> None:
         """Draws a stroke along a list of (x, y) coordinates using Cairo."""
@@ -311,18 +607,43 @@ class ImageProcessor:
             ctx = cairo.Context(self._current_surface)
 
             # Set brush properties
-            r, g, b, a = [c / 255.0 for c in self._brush_color]
-            ctx.set_source_rgba(r, g, b, a)
+            ctx.set_source_rgba(*self._brush_rgba)
             ctx.set_line_width(self._brush_size)
             ctx.set_line_cap(cairo.LINE_CAP_ROUND)
             ctx.set_line_join(cairo.LINE_JOIN_ROUND)
 
-            # Draw the line
-            ctx.move_to(points[0][0], points[0][1])
-            for point in points[1:]:
-                ctx.line_to(point[0], point[1])
+            # Draw the line; repeated pointer samples on the same pixel add
+            # nothing to the path, so only position changes reach Cairo
+            last_x, last_y = points[0]
+            ctx.move_to(last_x, last_y)
+            line_to = ctx.line_to
+            segments = 0
+            for x, y in points:
+                if x != last_x or y != last_y:
+                    line_to(x, y)
+                    last_x, last_y = x, y
+                    segments += 1
+            if not segments:
+                # A stationary stroke still leaves a round-capped dot
+                line_to(last_x, last_y)
 
             ctx.stroke()
+            if self._stroke_before is not None:
+                self._grow_stroke_bbox(points)
+            self._mark_changed()
+
+    def _grow_stroke_bbox(self, points: list) -> None:
+        """Extends the pending stroke's dirty area by a segment's extents."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        pad = self._brush_size / 2.0 + 2
+        x0, y0 = min(xs) - pad, min(ys) - pad
+        x1, y1 = max(xs) + pad, max(ys) + pad
+        if self._stroke_bbox:
+            bx, by, bw, bh = self._stroke_bbox
+            x0, y0 = min(x0, bx), min(y0, by)
+            x1, y1 = max(x1, bx + bw), max(y1, by + bh)
+        self._stroke_bbox = (x0, y0, x1 - x0, y1 - y0)
 
     def draw_brush_dab(self, point: tuple) -> None:
         """Draws a single dab of the brush at the given point using Cairo.
@@ -331,64 +652,82 @@ class ImageProcessor:
             point: Tuple of (x, y) coordinates for the brush dab center.
         """
         if self._current_surface:
-            self.save_state()
-            ctx = cairo.Context(self._current_surface)
-
-            r, g, b, a = [c / 255.0 for c in self._brush_color]
-            ctx.set_source_rgba(r, g, b, a)
-
             x, y = point
             radius = self._brush_size / 2.0
+            pad = radius + 2
+            self.save_state((x - pad, y - pad, 2 * pad, 2 * pad))
+            stamp, center = self._get_brush_stamp()
 
-            ctx.arc(x, y, radius, 0, 2 * math.pi)
-            ctx.fill()
+            # The pre-rendered dab is composited (OVER) in one paint, without
+            # building and filling an arc path for every dab
+            ctx = cairo.Context(self._current_surface)
+            ctx.set_source_surface(stamp, x - center, y - center)
+            ctx.paint()
+            self._mark_changed()
+
+    def _get_brush_stamp(self) -> tuple:
+        """Returns the current brush's dab surface and its center offset."""
+        return _build_brush_stamp(self._brush_size, self._brush_color)
 
     def set_font_path(self, font_path: str) -> None:
         """Sets the font path for text tool."""
         self._font_path = font_path
+        self._font_description = None
 
     def add_text(self, text: str, x: int, y: int, font_path: str = None) -> None:
-        """Adds text to the image using Cairo."""
+        """Adds text to the image using a PangoCairo layout.
+
+        Args:
+            text: Text to draw; newlines start new lines.
+            x: Left edge of the text in image coordinates.
+            y: Top edge of the text in image coordinates.
+            font_path: Font family overriding the selected one. Defaults to None.
+        """
         if self._current_surface:
             self.paste_selection()
-            self.save_state()
             ctx = cairo.Context(self._current_surface)
 
             # Set text color
-            r, g, b, a = [c / 255.0 for c in self._brush_color]
-            ctx.set_source_rgba(r, g, b, a)
+            ctx.set_source_rgba(*self._brush_rgba)
 
-            # Set font options
-            # Note: While font family is selected, Cairo's native text API (toy text API)
-            # has limited capabilities for font matching and may not always
-            # render the exact requested font, silently falling back to a default.
-            # For robust font handling and advanced text layout, Pango/PangoCairo
-            # would be required, but this is a significant integration effort.
-            target_font = font_path if font_path else self._font_path
-            if target_font:
-                # This is a simplification. Real font handling is more complex.
-                ctx.select_font_face(
-                    target_font, cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
+            layout = PangoCairo.create_layout(ctx)
+            if font_path and font_path != self._font_path:
+                layout.set_font_description(
+                    self._build_font_description(font_path, self._text_size)
                 )
             else:
-                # Default font
-                ctx.select_font_face(
-                    "sans-serif", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
-                )
-
-            ctx.set_font_size(self._text_size)
-
-            # Get font extents to correctly position text
-            # Cairo draws from baseline, but input coordinate is top-left
-            extents = ctx.font_extents()
-            ascent = extents[0]
-            line_height = extents[2]
+                layout.set_font_description(self._get_font_description())
+            layout.set_text(text, -1)
+
+            # The layout origin is its top-left corner, matching the input
+            # coordinate; only the ink area is kept for undo
+            ink, _ = layout.get_pixel_extents()
+            # Antialiasing can bleed a pixel past the reported extents
+            self.save_state(
+                (x + ink.x - 2, y + ink.y - 2, ink.width + 4, ink.height + 4)
+            )
+            ctx.move_to(x, y)
+            PangoCairo.show_layout(ctx, layout)
+            self._mark_changed()
+
+    def _get_font_description(self) -> Pango.FontDescription:
+        """Returns the font description for the current family and size."""
+        if self._font_description is None:
+            self._font_description = self._build_font_description(
+                self._font_path, self._text_size
+            )
+        return self._font_description
 
-            # Position and draw text (handle newlines)
-            lines = text.split("\n")
-            for i, line in enumerate(lines):
-                ctx.move_to(x, y + ascent + (i * line_height))
-                ctx.show_text(line)
+    @staticmethod
+    def _build_font_description(family: str, size: int) -> Pango.FontDescription:
+        """Builds a font description for a family at a pixel size."""
+        # set_family() takes the name literally; from_string() would read
+        # trailing words like "Light" or "Condensed" as style or stretch
+        font_description = Pango.FontDescription()
+        font_description.set_family(family or "sans-serif")
+        # Absolute size keeps the text tool in pixels, like the entry preview
+        font_description.set_absolute_size(size * Pango.SCALE)
+        return font_description
 
     def save_image(self, filepath: str) -> None:
         """Saves the current Cairo surface to a PNG file."""
@@ -410,32 +749,71 @@ class ImageProcessor:
 
         new_width = max(1, int(new_width))
         new_height = max(1, int(new_height))
-        anchor_x, anchor_y = anchor
 
         # Create new surface and fill with color
         new_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, new_width, new_height)
-        ctx = cairo.Context(new_surface)
-        r, g, b, a = [c / 255.0 for c in fill_color]
-        ctx.set_source_rgba(r, g, b, a)
-        ctx.paint()
 
         # Calculate offset and draw old surface onto new one
-        offset_x = self._compute_anchor_offset(
-            anchor_x, self._current_surface.get_width(), new_width
-        )
-        offset_y = self._compute_anchor_offset(
-            anchor_y, self._current_surface.get_height(), new_height
-        )
-
-        ctx.set_source_surface(self._current_surface, offset_x, offset_y)
-        ctx.paint()
+        old_width = self._current_surface.get_width()
+        old_height = self._current_surface.get_height()
+        halves_x, halves_y = _ANCHOR_HALVES.get(anchor, (1, 1))
+        offset_x = (new_width - old_width) * halves_x // 2
+        offset_y = (new_height - old_height) * halves_y // 2
+
+        if fill_color[3]:
+            # Translucent old pixels blend over the fill, as before
+            ctx = cairo.Context(new_surface)
+            r, g, b, a = _normalize_rgba(fill_color)
+            ctx.set_source_rgba(r, g, b, a)
+            ctx.paint()
+            ctx.set_source_surface(self._current_surface, offset_x, offset_y)
+            ctx.paint()
+        else:
+            # A transparent fill is the zeroed new surface; copy, don't blend
+            self._blit_rect(
+                new_surface,
+                self._current_surface,
+                0,
+                0,
+                old_width,
+                old_height,
+                offset_x,
+                offset_y,
+            )
 
         self._current_surface = new_surface
+        self._notify_surface_replaced()
+
+    @staticmethod
+    def _clear_rect(surface, x, y, w, h) -> None:
+        """Zeroes a pixel-aligned rectangle of an ARGB32 surface in place.
+
+        Transparent black is all-zero bytes, so each row is a plain buffer
+        write with no rasterizer involved.
+        """
+        x0, y0 = max(0, x), max(0, y)
+        x1 = min(surface.get_width(), x + w)
+        y1 = min(surface.get_height(), y + h)
+        if x1 <= x0 or y1 <= y0:
+            return
+        start = x0 * 4
+        zeros = bytes((x1 - x0) * 4)
+        row_len = len(zeros)
+        with _edit_pixels(surface, x0, y0, x1 - x0, y1 - y0) as (data, stride):
+            for row in range(y0, y1):
+                offset = row * stride + start
+                data[offset : offset + row_len] = zeros
 
     @staticmethod
-    def _compute_anchor_offset(anchor, old_size, new_size):
-        if anchor in ("left", "top"):
-            return 0
-        if anchor in ("right", "bottom"):
-            return new_size - old_size
-        return (new_size - old_size) // 2
+    def _blit_rect(dst, src, sx, sy, w, h, dx, dy) -> None:
+        """Copies a w x h block of src at (sx, sy) to dst at (dx, dy).
+
+        The copy uses OPERATOR_SOURCE clipped to the target rectangle, so
+        pixman takes its plain copy path instead of blending, and pixels the
+        source does not cover are left transparent.
+        """
+        ctx = cairo.Context(dst)
+        ctx.set_operator(cairo.OPERATOR_SOURCE)
+        ctx.set_source_surface(src, dx - sx, dy - sy)
+        ctx.rectangle(dx, dy, w, h)
+        ctx.fill()
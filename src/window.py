@@ -5,19 +5,132 @@ toolbar, canvas, and event handlers.
 """
 
 import datetime
-import io
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import cairo
 import gi
 
 gi.require_version("Gtk", "4.0")
-gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import Gtk, Gio, Gdk, GLib  # noqa: E402
+from gi.repository import Gtk, Gio, Gdk, GLib, GObject  # noqa: E402
 
 from .processor import ImageProcessor  # noqa: E402
-from .manager import ToolManager  # noqa: E402
-from .canvas import CanvasWidget  # noqa: E402
+from .manager import Tool, ToolManager  # noqa: E402
+from .canvas import CanvasWidget, surface_to_texture, texture_to_surface  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Red by default, matching ImageProcessor's initial brush color; set_rgba()
+# copies the value, so the constant can be shared
+_DEFAULT_BRUSH_RGBA = Gdk.RGBA()
+(
+    _DEFAULT_BRUSH_RGBA.red,
+    _DEFAULT_BRUSH_RGBA.green,
+    _DEFAULT_BRUSH_RGBA.blue,
+    _DEFAULT_BRUSH_RGBA.alpha,
+) = (1.0, 0.0, 0.0, 1.0)
+
+
+def _modifier_combos(*masks) -> tuple:
+    """Returns every combination of the given modifier masks, including none."""
+    combos = [Gdk.ModifierType(0)]
+    for mask in masks:
+        combos += [combo | mask for combo in combos]
+    return tuple(combos)
+
+
+# Delete works with any of these held, like the old key handler
+_DELETE_MODIFIER_COMBOS = _modifier_combos(
+    Gdk.ModifierType.SHIFT_MASK,
+    Gdk.ModifierType.CONTROL_MASK,
+    Gdk.ModifierType.ALT_MASK,
+    Gdk.ModifierType.SUPER_MASK,
+)
+
+# Font families offered by the text tool, in dropdown order
+_FONT_FAMILIES = ("sans-serif", "serif", "monospace")
+
+# Decodes opened files off the main loop; one worker keeps loads in order
+_decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="decode")
+
+APP_CSS = b"""
+.toolbar-container {
+    margin-bottom: 8px;
+    margin-left: 8px;
+}
+.padded-button {
+    padding: 5px 10px;
+}
+
+textview.canvas-text-overlay,
+textview.canvas-text-overlay text,
+textview.canvas-text-overlay view {
+    background-color: transparent;
+}
+
+textview.canvas-text-overlay border {
+    border: 1px dashed transparent;
+    border-radius: 4px;
+}
+"""
+
+# Opt-in rules for software rendering (GNIE_FAST_CSS=1): no shadow or blur
+# render nodes and no transition ticks on the window chrome
+FAST_CSS = b"""
+window, headerbar, button, box {
+    box-shadow: none;
+    transition: none;
+}
+headerbar, box {
+    border-radius: 0;
+}
+"""
+
+_app_css_provider = None
+
+
+def install_app_stylesheet(display: Gdk.Display) -> None:
+    """Registers the application stylesheet for a display.
+
+    The stylesheet is parsed once per process; widgets opt in through CSS
+    classes instead of attaching providers of their own. FAST_CSS is
+    appended when the GNIE_FAST_CSS environment variable is set.
+
+    Args:
+        display: The display to register the stylesheet on.
+    """
+    global _app_css_provider
+    if _app_css_provider is not None:
+        return
+    _app_css_provider = Gtk.CssProvider()
+    css = APP_CSS
+    if os.environ.get("GNIE_FAST_CSS"):
+        css += FAST_CSS
+    _app_css_provider.load_from_data(css)
+    Gtk.StyleContext.add_provider_for_display(
+        display,
+        _app_css_provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
+
+
+def _shortcut_action(handler) -> Gtk.CallbackAction:
+    """Wraps a no-argument handler as a shortcut action that claims the key."""
+
+    def activate(widget, args):
+        handler()
+        return True
+
+    return Gtk.CallbackAction.new(activate)
+
+
+def _is_dialog_dismissed(error: GLib.Error) -> bool:
+    """Returns whether a Gtk.FileDialog error only means the user backed out."""
+    quark = Gtk.dialog_error_quark()
+    return error.matches(quark, Gtk.DialogError.DISMISSED) or error.matches(
+        quark, Gtk.DialogError.CANCELLED
+    )
 
 
 class MainWindow(Gtk.ApplicationWindow):
@@ -29,30 +142,22 @@ class MainWindow(Gtk.ApplicationWindow):
         self.processor = ImageProcessor()
         self.manager = ToolManager()
 
+        # Brush color applied last, packed as 0xAARRGGBB; starts at the
+        # processor's default red
+        self._last_brush_packed = 0xFFFF0000
+
+        self._clipboard = Gdk.Display.get_default().get_clipboard()
+        self._last_tool = None  # Tool the tool-specific controls were set up for
+        self._load_serial = 0  # Bumped per open, so only the newest decode lands
+        # Latest (tool, size) from the size slider and its pending timeout
+        self._pending_size = None
+        self._size_timeout_id = None
+
         self.set_default_size(800, 600)
         self.set_title("GNOME Nano Image Edit")
 
         self._setup_icon()
 
-        # CSS Provider for styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(
-            b"""
-            .toolbar-container {
-                margin-bottom: 8px;
-                margin-left: 8px;
-            }
-            .padded-button {
-                padding: 5px 10px;
-            }
-        """
-        )
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
-
         # Header Bar
         header_bar = Gtk.HeaderBar()
         self.set_titlebar(header_bar)
@@ -78,30 +183,26 @@ class MainWindow(Gtk.ApplicationWindow):
         menu_button.set_menu_model(menu)
 
         # Actions
-        action_about = Gio.SimpleAction.new("about", None)
-        action_about.connect("activate", self.on_about_activated)
-        self.add_action(action_about)
-
-        action_shortcuts = Gio.SimpleAction.new("shortcuts", None)
-        action_shortcuts.connect("activate", self.on_shortcuts_activated)
-        self.add_action(action_shortcuts)
+        self.add_action_entries(
+            [
+                ("about", self.on_about_activated),
+                ("shortcuts", self.on_shortcuts_activated),
+            ]
+        )
 
         # Main layout
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.set_child(main_box)
 
-        # Canvas & Overlay
+        # Canvas; the overlay for the text tool is added by _ensure_overlay()
         self.canvas = CanvasWidget(self.processor, self.manager)
-        self.overlay = Gtk.Overlay()
-        self.overlay.set_child(self.canvas)
-        # Pass overlay to canvas for text tool
-        self.canvas.set_overlay(self.overlay)
+        self.overlay = None
 
         # Scrolled Window (Canvas Container) - Add this FIRST
-        scrolled_window = Gtk.ScrolledWindow()
-        scrolled_window.set_child(self.overlay)
-        scrolled_window.set_vexpand(True)
-        main_box.append(scrolled_window)
+        self._scrolled_window = Gtk.ScrolledWindow()
+        self._scrolled_window.set_child(self.canvas)
+        self._scrolled_window.set_vexpand(True)
+        main_box.append(self._scrolled_window)
 
         # Toolbar Container - Add this SECOND (Bottom)
         toolbar_container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -111,38 +212,34 @@ class MainWindow(Gtk.ApplicationWindow):
         # Tool Selector Box
         tool_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         tool_box.set_halign(Gtk.Align.START)
+        # Equal-width buttons come from the box itself, in its own measure pass
+        tool_box.set_homogeneous(True)
         toolbar_container.append(tool_box)
 
         # Tool Buttons
-        tool_size_group = Gtk.SizeGroup(mode=Gtk.SizeGroupMode.HORIZONTAL)
-
         self.select_button = Gtk.ToggleButton(label="Select")
         self.select_button.add_css_class("padded-button")
-        tool_size_group.add_widget(self.select_button)
         tool_box.append(self.select_button)
 
         self.crop_button = Gtk.Button(label="Crop")
         self.crop_button.add_css_class("padded-button")
-        tool_size_group.add_widget(self.crop_button)
         tool_box.append(self.crop_button)
 
         self.brush_button = Gtk.ToggleButton(label="Brush")
         self.brush_button.set_group(self.select_button)
         self.brush_button.add_css_class("padded-button")
-        tool_size_group.add_widget(self.brush_button)
         tool_box.append(self.brush_button)
 
         self.text_button = Gtk.ToggleButton(label="Text")
         self.text_button.set_group(self.select_button)
         self.text_button.add_css_class("padded-button")
-        tool_size_group.add_widget(self.text_button)
         tool_box.append(self.text_button)
 
         # Connect signals
-        self.select_button.connect("toggled", self.on_tool_toggled, "select")
+        self.select_button.connect("toggled", self.on_tool_toggled, Tool.SELECT)
         self.crop_button.connect("clicked", self.on_crop_clicked)
-        self.brush_button.connect("toggled", self.on_tool_toggled, "brush")
-        self.text_button.connect("toggled", self.on_tool_toggled, "text")
+        self.brush_button.connect("toggled", self.on_tool_toggled, Tool.BRUSH)
+        self.text_button.connect("toggled", self.on_tool_toggled, Tool.TEXT)
 
         # Brush Controls (initially hidden)
         self.brush_controls_box = Gtk.Box(
@@ -152,227 +249,279 @@ class MainWindow(Gtk.ApplicationWindow):
         self.brush_controls_box.set_hexpand(True)
         toolbar_container.append(self.brush_controls_box)
 
-        # Brush Size
-        self.brush_size_scale = Gtk.Scale.new_with_range(
-            Gtk.Orientation.HORIZONTAL, 1, 100, 1
-        )
-        self.brush_size_scale.set_value(10)
-        self.brush_size_scale.set_hexpand(True)
-        self.brush_size_scale.connect("value-changed", self.on_tool_size_changed)
-        self.brush_controls_box.append(self.brush_size_scale)
-
-        size_label = Gtk.Label(label="Size")
-        self.brush_controls_box.append(size_label)
-
-        # Brush Color
-        color_label = Gtk.Label(label="Color")
-        self.brush_controls_box.append(color_label)
-        self.brush_color_button = Gtk.ColorButton()
-        default_rgba = Gdk.RGBA()
-        default_rgba.parse("#ff0000ff")  # let us use red by default
-        self.brush_color_button.set_rgba(default_rgba)
-        self.brush_color_button.connect("color-set", self.on_brush_color_set)
-        self.brush_controls_box.append(self.brush_color_button)
-
-        # Font Selection (initially hidden, shown for Text tool)
-        fonts = ["sans-serif", "serif", "monospace"]
-        self.font_dropdown = Gtk.DropDown.new_from_strings(fonts)
-        self.font_dropdown.connect("notify::selected-item", self.on_font_changed)
-        self.brush_controls_box.append(self.font_dropdown)
+        # The controls inside are built after the first frame; see
+        # _ensure_tool_controls()
+        self.brush_size_scale = None
+        self.brush_color_button = None
+        self.font_dropdown = None
+        GLib.idle_add(self._ensure_tool_controls, priority=GLib.PRIORITY_LOW)
 
         # Set default tool
         self.select_button.set_active(True)
 
-        # Key Controller
-        key_controller = Gtk.EventControllerKey()
-        key_controller.connect("key-pressed", self.on_key_pressed)
-        self.add_controller(key_controller)
+        # Shortcuts are matched by GTK; only an exact match calls into Python
+        shortcut_controller = Gtk.ShortcutController()
+        for accelerator, handler in (
+            ("<Control>z", self._do_undo),
+            ("<Control>y", self._do_redo),
+            ("<Control>s", self._do_save),
+            ("<Control>o", self._do_open),
+            ("<Control>c", self.copy_to_clipboard),
+            ("<Control>x", self.cut_to_clipboard),
+            ("<Control>v", self.paste_from_clipboard),
+            ("<Control>t", self._do_text_tool),
+        ):
+            shortcut_controller.add_shortcut(
+                Gtk.Shortcut.new(
+                    Gtk.ShortcutTrigger.parse_string(accelerator),
+                    _shortcut_action(handler),
+                )
+            )
+        # Delete clears the selection whatever modifiers are held; triggers
+        # match modifiers exactly, so every combination gets its own
+        delete_action = _shortcut_action(self._do_delete)
+        for modifiers in _DELETE_MODIFIER_COMBOS:
+            shortcut_controller.add_shortcut(
+                Gtk.Shortcut.new(
+                    Gtk.KeyvalTrigger.new(Gdk.KEY_Delete, modifiers),
+                    delete_action,
+                )
+            )
+        self.add_controller(shortcut_controller)
 
         # Create a blank canvas by default so tools work immediately
         self.processor.create_blank_image()
-        self.file_dialog = None
-
-    def on_about_activated(self, widget, _):
-        about_dialog = Gtk.AboutDialog(
-            transient_for=self,
-            modal=True,
-            program_name="GNOME Nano Image Edit",
-            version="0.1.0",
-            copyright="© 2025-2026 Verner K.",
-            license_type=Gtk.License.GPL_3_0,
-            website="https://github.com/konverner/gnome-nano-image-edit",
-            comments="This program comes with absolutely no warranty.",
-            authors=["Verner K."], # Optional
-            # translators=["Your Name <your.email@example.com>"], # Optional
-        )
-        # Set the application icon
-        try:
-            about_dialog.set_logo_icon_name("com.github.konverner.gnome-nano-image-edit")
-        except Exception as e:
-            print(f"Warning: Failed to set about dialog icon: {e}")
-        about_dialog.present()
-
-    def on_shortcuts_activated(self, widget, _):
-        shortcuts_window = Gtk.ShortcutsWindow(
-            transient_for=self,
-            modal=True,
-            title="Keyboard Shortcuts"
-        )
+        # File dialogs and secondary windows are built on first use and reused
+        self._open_dialog = None
+        self._save_dialog = None
+        self._about_dialog = None
+        self._shortcuts_window = None
+
+    def on_about_activated(self, action, parameter, user_data=None):
+        if self._about_dialog is None:
+            about_dialog = Gtk.AboutDialog(
+                transient_for=self,
+                modal=True,
+                program_name="GNOME Nano Image Edit",
+                version="0.1.0",
+                copyright="© 2025-2026 Verner K.",
+                license_type=Gtk.License.GPL_3_0,
+                website="https://github.com/konverner/gnome-nano-image-edit",
+                comments="This program comes with absolutely no warranty.",
+                authors=["Verner K."], # Optional
+                # translators=["Your Name <your.email@example.com>"], # Optional
+            )
+            # Set the application icon
+            try:
+                about_dialog.set_logo_icon_name("com.github.konverner.gnome-nano-image-edit")
+            except Exception as e:
+                logger.warning("Failed to set about dialog icon: %s", e)
+            # Hidden on close and presented again on the next activation
+            about_dialog.set_hide_on_close(True)
+            self._about_dialog = about_dialog
+        self._about_dialog.present()
+
+    def on_shortcuts_activated(self, action, parameter, user_data=None):
+        if self._shortcuts_window is None:
+            shortcuts_window = Gtk.ShortcutsWindow(
+                transient_for=self,
+                modal=True,
+                title="Keyboard Shortcuts"
+            )
 
-        # Create a section for general shortcuts
-        section_general = Gtk.ShortcutsSection(title="General")
-        shortcuts_window.add_section(section_general)
+            # Create a section for general shortcuts
+            section_general = Gtk.ShortcutsSection(title="General")
+            shortcuts_window.add_section(section_general)
 
-        # Create a group within the section
-        group_general = Gtk.ShortcutsGroup(title="General Actions")
-        section_general.add_group(group_general)
+            # Create a group within the section
+            group_general = Gtk.ShortcutsGroup(title="General Actions")
+            section_general.add_group(group_general)
 
-        # Add shortcuts to the group
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Open Image",
-                accelerator="<Control>o"
+            # Add shortcuts to the group
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Open Image",
+                    accelerator="<Control>o"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Save Image",
-                accelerator="<Control>s"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Save Image",
+                    accelerator="<Control>s"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Undo",
-                accelerator="<Control>z"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Undo",
+                    accelerator="<Control>z"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Redo",
-                accelerator="<Control>y"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Redo",
+                    accelerator="<Control>y"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Copy Selection",
-                accelerator="<Control>c"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Copy Selection",
+                    accelerator="<Control>c"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Cut Selection",
-                accelerator="<Control>x"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Cut Selection",
+                    accelerator="<Control>x"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Paste Selection",
-                accelerator="<Control>v"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Paste Selection",
+                    accelerator="<Control>v"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Activate Text Tool",
-                accelerator="<Control>t"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Activate Text Tool",
+                    accelerator="<Control>t"
+                )
             )
-        )
-        group_general.add_shortcut(
-            Gtk.ShortcutsShortcut(
-                title="Delete Selection",
-                accelerator="Delete"
+            group_general.add_shortcut(
+                Gtk.ShortcutsShortcut(
+                    title="Delete Selection",
+                    accelerator="Delete"
+                )
             )
-        )
 
-
-        shortcuts_window.present()
+            # Hidden on close and presented again on the next activation
+            shortcuts_window.set_hide_on_close(True)
+            self._shortcuts_window = shortcuts_window
+        self._shortcuts_window.present()
 
     def _setup_icon(self):
         """Configure the application icon from the installed icon theme."""
         try:
             self.set_icon_name("com.github.konverner.gnome-nano-image-edit")
         except Exception as e:
-            print(f"Warning: Failed to set application icon: {e}")
+            logger.warning("Failed to set application icon: %s", e)
+
+    def _ensure_tool_controls(self):
+        """Builds the brush and text controls if they do not exist yet.
+
+        They start hidden, so building them is deferred to a low-priority
+        idle after the window is first shown; selecting a tool that needs
+        them first builds them on the spot.
+
+        Returns:
+            GLib.SOURCE_REMOVE, so the idle callback runs once.
+        """
+        if self.brush_size_scale is not None:
+            return GLib.SOURCE_REMOVE
+
+        # Brush Size
+        self.brush_size_scale = Gtk.Scale.new_with_range(
+            Gtk.Orientation.HORIZONTAL, 1, 100, 1
+        )
+        self.brush_size_scale.set_value(10)
+        self.brush_size_scale.set_hexpand(True)
+        self.brush_size_scale.connect("value-changed", self.on_tool_size_changed)
+        self.brush_controls_box.append(self.brush_size_scale)
+
+        size_label = Gtk.Label(label="Size")
+        self.brush_controls_box.append(size_label)
+
+        # Brush Color
+        color_label = Gtk.Label(label="Color")
+        self.brush_controls_box.append(color_label)
+        self.brush_color_button = Gtk.ColorButton()
+        self.brush_color_button.set_rgba(_DEFAULT_BRUSH_RGBA)
+        self.brush_color_button.connect("color-set", self.on_brush_color_set)
+        self.brush_controls_box.append(self.brush_color_button)
+
+        # Font Selection (initially hidden, shown for Text tool)
+        self.font_dropdown = Gtk.DropDown.new_from_strings(_FONT_FAMILIES)
+        self.font_dropdown.connect("notify::selected", self.on_font_changed)
+        self.brush_controls_box.append(self.font_dropdown)
+        return GLib.SOURCE_REMOVE
+
+    def _ensure_overlay(self):
+        """Wraps the canvas in the Gtk.Overlay the text tool needs.
+
+        The overlay only hosts the text entry, so it is created the first
+        time the text tool is chosen rather than measured and snapshotted
+        on every frame from startup. Once created it is kept.
+        """
+        if self.overlay is not None:
+            return
+        self.overlay = Gtk.Overlay()
+        self._scrolled_window.set_child(None)
+        self.overlay.set_child(self.canvas)
+        self._scrolled_window.set_child(self.overlay)
+        # Pass overlay to canvas for text tool
+        self.canvas.set_overlay(self.overlay)
 
     def _update_tool_ui(self):
         """Show or hide tool-specific controls."""
         tool = self.manager.current_tool
-        show_controls = tool in ["brush", "text"]
+        if tool == self._last_tool:
+            return
+        self._last_tool = tool
+        show_controls = tool in (Tool.BRUSH, Tool.TEXT)
         self.brush_controls_box.set_visible(show_controls)
 
-        # Show/Hide specific controls based on tool
-        if tool == "text":
-            self.font_dropdown.set_visible(True)
-        else:
-            self.font_dropdown.set_visible(False)
+        if tool == Tool.TEXT:
+            self._ensure_overlay()
 
-        # Update scale value based on tool
-        if tool == "brush":
-            self.brush_size_scale.set_value(self.processor._brush_size)
-        elif tool == "text":
-            self.brush_size_scale.set_value(self.processor._text_size)
+        if show_controls:
+            self._ensure_tool_controls()
 
-        if tool != "text":
-            self.canvas.hide_text_entry()
+            # Show/Hide specific controls based on tool
+            self.font_dropdown.set_visible(tool == Tool.TEXT)
 
-    def on_key_pressed(self, controller, keyval, keycode, state):
-        """Handle key press events."""
-        ctrl = state & Gdk.ModifierType.CONTROL_MASK
+            # Update scale value based on tool; an equal value would only
+            # bounce back through value-changed
+            if tool == Tool.BRUSH:
+                size = self.processor._brush_size
+            else:
+                size = self.processor._text_size
+            if self.brush_size_scale.get_value() != size:
+                self.brush_size_scale.set_value(size)
+
+        if tool != Tool.TEXT:
+            self.canvas.hide_text_entry()
 
+    def _do_undo(self):
         # Undo: Ctrl+Z
-        if ctrl and keyval == Gdk.KEY_z:
-            if self.processor.undo():
-                self.canvas.queue_draw()
-            return True
+        if self.processor.undo():
+            self.canvas.request_redraw()
 
+    def _do_redo(self):
         # Redo: Ctrl+Y
-        if ctrl and keyval == Gdk.KEY_y:
-            if self.processor.redo():
-                self.canvas.queue_draw()
-            return True
+        if self.processor.redo():
+            self.canvas.request_redraw()
 
+    def _do_save(self):
         # Save: Ctrl+S
-        if ctrl and keyval == Gdk.KEY_s:
-            self.on_save_clicked(None)
-            return True
+        self.on_save_clicked(None)
 
+    def _do_open(self):
         # Open: Ctrl+O
-        if ctrl and keyval == Gdk.KEY_o:
-            self.on_open_clicked(None)
-            return True
-
-        # Copy: Ctrl+C
-        if ctrl and keyval == Gdk.KEY_c:
-            self.copy_to_clipboard()
-            return True
-
-        # Cut: Ctrl+X
-        if ctrl and keyval == Gdk.KEY_x:
-            self.cut_to_clipboard()
-            return True
-
-        # Paste: Ctrl+V
-        if ctrl and keyval == Gdk.KEY_v:
-            self.paste_from_clipboard()
-            return True
+        self.on_open_clicked(None)
 
+    def _do_text_tool(self):
         # Text Tool: Ctrl+T
-        if ctrl and keyval == Gdk.KEY_t:
-            self.text_button.set_active(True)
-            return True
+        self.text_button.set_active(True)
 
+    def _do_delete(self):
         # Delete key handling
-        if keyval == Gdk.KEY_Delete:
-            if self.processor._selection_box:
-                if self.processor._floating_selection_data:
-                    self.processor.clear_floating_selection()
-                else:
-                    # Clear the selected area
-                    self.processor.cut_selection(self.processor._selection_box)
-                    self.processor.clear_floating_selection()
-                self.canvas.queue_draw()
-            return True
-
-        return False
+        if self.processor._selection_box:
+            if self.processor._floating_selection_data:
+                self.processor.clear_floating_selection()
+            else:
+                # Clear the selected area
+                self.processor.cut_selection(self.processor._selection_box)
+                self.processor.clear_floating_selection()
+            self.canvas.request_redraw()
 
     def copy_to_clipboard(self):
         """Copy current selection to clipboard."""
@@ -401,7 +550,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 # But does it leave a floating selection?
                 # In Paint, Cut removes it and puts on clipboard. It does NOT leave a floating selection.
                 self.processor.clear_floating_selection()
-            self.canvas.queue_draw()
+            self.canvas.request_redraw()
 
     def _copy_image_to_clipboard(self, surface: cairo.Surface) -> None:
         """Helper to put Cairo surface on clipboard.
@@ -409,21 +558,17 @@ class MainWindow(Gtk.ApplicationWindow):
         Args:
             surface: The Cairo surface to copy to clipboard.
         """
-        clipboard = Gdk.Display.get_default().get_clipboard()
-
-        # Convert Cairo surface to GdkTexture
-        b = io.BytesIO()
-        surface.write_to_png(b)
-        data = b.getvalue()
-        bytes_obj = GLib.Bytes.new(data)
-
-        content = Gdk.ContentProvider.new_for_bytes("image/png", bytes_obj)
-        clipboard.set_content(content)
+        # Offer the raw pixels as a texture; GTK only encodes PNG on demand
+        # when another application asks for image/png
+        texture = surface_to_texture(surface)
+        content = Gdk.ContentProvider.new_for_value(
+            GObject.Value(Gdk.Texture, texture)
+        )
+        self._clipboard.set_content(content)
 
     def paste_from_clipboard(self):
         """Paste from clipboard."""
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        clipboard.read_texture_async(None, self._on_paste_texture_ready)
+        self._clipboard.read_texture_async(None, self._on_paste_texture_ready)
 
     def _on_paste_texture_ready(self, clipboard: Gdk.Clipboard, result) -> None:
         """Callback for paste operation when texture is ready.
@@ -436,16 +581,12 @@ class MainWindow(Gtk.ApplicationWindow):
             texture = clipboard.read_texture_finish(result)
             if texture:
                 # Convert GdkTexture to Cairo Surface
-                bytes_obj = texture.save_to_png_bytes()
-
-                # Create a Cairo surface from the PNG data
-                with io.BytesIO(bytes_obj.get_data()) as f:
-                    surface = cairo.ImageSurface.create_from_png(f)
+                surface = texture_to_surface(texture)
 
                 # Set as floating selection
                 self.processor.set_floating_selection(surface, 0, 0)
-                self.manager.current_tool = "select"  # Switch to select tool to move it
-                self.canvas.queue_draw()
+                self.manager.current_tool = Tool.SELECT  # Switch to select tool to move it
+                self.canvas.request_redraw()
         except Exception as e:
             self.show_error(f"Failed to paste image: {e}")
 
@@ -464,166 +605,189 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def on_open_clicked(self, widget):
         """Handle the Open button click."""
-        print("DEBUG: on_open_clicked called")
-        self.file_dialog = Gtk.FileChooserDialog(
-            title="Please choose a file",
-            transient_for=self,
-            action=Gtk.FileChooserAction.OPEN,
-        )
-        self.file_dialog.add_buttons(
-            "_Cancel", Gtk.ResponseType.CANCEL, "_Open", Gtk.ResponseType.ACCEPT
-        )
-        print("DEBUG: Gtk.FileChooserDialog created")
-
-        filter_img = Gtk.FileFilter()
-        filter_img.set_name("Image files")
-        filter_img.add_mime_type("image/png")
-        filter_img.add_mime_type("image/jpeg")
-        filter_img.add_mime_type("image/gif")
-        self.file_dialog.add_filter(filter_img)
-        print("DEBUG: Image filter added")
-
-        filter_all = Gtk.FileFilter()
-        filter_all.set_name("All files")
-        filter_all.add_pattern("*")
-        self.file_dialog.add_filter(filter_all)
-        print("DEBUG: All files filter added")
-
-        self.file_dialog.connect("response", self._on_open_dialog_response)
-        print("DEBUG: 'response' signal connected")
-        self.file_dialog.show()
-        print("DEBUG: dialog.show() called")
-
-    def _on_open_dialog_response(self, dialog, response_id):
-        """Handle the response from the file chooser dialog."""
-        print(f"DEBUG: _on_open_dialog_response called with response_id: {response_id}")
-        if response_id == Gtk.ResponseType.ACCEPT:
-            print("DEBUG: Response is ACCEPT")
-            try:
-                file = dialog.get_file()
-                if file:
-                    file_path = file.get_path()
-                    print(f"DEBUG: File selected: {file_path}")
-
-                    # Check file size restrictions (0.01MB to 8MB)
-                    file_size = os.path.getsize(file_path)
-                    min_size = 10 * 1024  # 0.01 MB
-                    max_size = 8 * 1024 * 1024  # 8 MB
-
-                    if not (min_size <= file_size <= max_size):
-                        print("DEBUG: File size error")
-                        self.show_error("File size must be between 0.01 MB and 8.0 MB.")
-                    else:
-                        print("DEBUG: Loading image...")
-                        self.processor.load_image(file_path)
-                        self.canvas.queue_draw()
-                        print("DEBUG: Image loaded and canvas queued for draw")
-                else:
-                    print("DEBUG: dialog.get_file() returned None")
-            except GLib.Error as e:
-                print(f"DEBUG: GLib.Error: {e}")
-                self.show_error(f"Failed to open file: {e}")
-            except cairo.Error as e:
-                print(f"DEBUG: cairo.Error: {e}")
-                self.show_error(
-                    f"Failed to open image: {e}. The file may be corrupt or an unsupported format."
+        logger.debug("on_open_clicked called")
+        if self._open_dialog is None:
+            self._open_dialog = Gtk.FileDialog(title="Please choose a file", modal=True)
+            logger.debug("Gtk.FileDialog created")
+
+            filter_img = Gtk.FileFilter()
+            filter_img.set_name("Image files")
+            filter_img.add_mime_type("image/png")
+            filter_img.add_mime_type("image/jpeg")
+            filter_img.add_mime_type("image/gif")
+
+            filter_all = Gtk.FileFilter()
+            filter_all.set_name("All files")
+            filter_all.add_pattern("*")
+
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters.append(filter_img)
+            filters.append(filter_all)
+            self._open_dialog.set_filters(filters)
+            self._open_dialog.set_default_filter(filter_img)
+            logger.debug("Filters added")
+
+        self._open_dialog.open(self, None, self._on_open_dialog_finish)
+        logger.debug("dialog.open() called")
+
+    def _on_open_dialog_finish(self, dialog, result):
+        """Handle the result of the open file dialog."""
+        logger.debug("_on_open_dialog_finish called")
+        try:
+            file = dialog.open_finish(result)
+            if file:
+                logger.debug("File selected: %s", file.get_path())
+                # The size is queried asynchronously, so a slow network mount
+                # does not stall the main loop
+                file.query_info_async(
+                    Gio.FILE_ATTRIBUTE_STANDARD_SIZE,
+                    Gio.FileQueryInfoFlags.NONE,
+                    GLib.PRIORITY_DEFAULT,
+                    None,
+                    self._on_open_file_info_ready,
                 )
-            except Exception as e:
-                print(f"DEBUG: Exception: {e}")
-                self.show_error(f"An error occurred while opening the file: {e}")
-        elif response_id == Gtk.ResponseType.CANCEL:
-            print("DEBUG: Response is CANCEL")
-        else:
-            print(f"DEBUG: Response is something else: {response_id}")
+            else:
+                logger.debug("dialog.open_finish() returned None")
+        except GLib.Error as e:
+            if _is_dialog_dismissed(e):
+                logger.debug("Open dialog dismissed")
+                return
+            logger.debug("GLib.Error: %s", e)
+            self.show_error(f"Failed to open file: {e}")
+        except Exception as e:
+            logger.debug("Exception: %s", e)
+            self.show_error(f"An error occurred while opening the file: {e}")
+
+    def _on_open_file_info_ready(self, file, result):
+        """Check the chosen file's size and start decoding it."""
+        try:
+            file_size = file.query_info_finish(result).get_size()
+        except GLib.Error as e:
+            logger.debug("GLib.Error: %s", e)
+            self.show_error(f"Failed to open file: {e}")
+            return
+
+        # Check file size restrictions (0.01MB to 8MB)
+        min_size = 10 * 1024  # 0.01 MB
+        max_size = 8 * 1024 * 1024  # 8 MB
+
+        if not (min_size <= file_size <= max_size):
+            logger.debug("File size error")
+            self.show_error("File size must be between 0.01 MB and 8.0 MB.")
+            return
+
+        file_path = file.get_path()
+        logger.debug("Decoding image in the background...")
+        self._load_serial += 1
+        future = _decode_executor.submit(ImageProcessor.decode_image, file_path)
+        future.add_done_callback(
+            lambda f, serial=self._load_serial: GLib.idle_add(
+                self._install_decoded_image, file_path, f, serial
+            )
+        )
 
-        dialog.destroy()
-        self.file_dialog = None
-        print("DEBUG: dialog destroyed")
+    def _install_decoded_image(self, file_path, future, serial):
+        """Installs an image decoded by the worker thread; runs on the main loop.
+
+        Args:
+            file_path: Path the image was decoded from.
+            future: The finished decode job.
+            serial: Load counter value when the job was submitted.
+
+        Returns:
+            GLib.SOURCE_REMOVE, so the idle callback runs once.
+        """
+        if serial != self._load_serial:
+            # A newer file was chosen while this one was decoding
+            return GLib.SOURCE_REMOVE
+        try:
+            self.processor.install_image(future.result(), file_path)
+            self.canvas.request_redraw()
+            logger.debug("Image loaded and canvas queued for draw")
+        except GLib.Error as e:
+            logger.debug("GLib.Error: %s", e)
+            self.show_error(f"Failed to open file: {e}")
+        except cairo.Error as e:
+            logger.debug("cairo.Error: %s", e)
+            self.show_error(
+                f"Failed to open image: {e}. The file may be corrupt or an unsupported format."
+            )
+        except Exception as e:
+            logger.debug("Exception: %s", e)
+            self.show_error(f"An error occurred while opening the file: {e}")
+        return GLib.SOURCE_REMOVE
 
     def on_save_clicked(self, widget):
         """Handle the Save button click."""
-        print("DEBUG: on_save_clicked called")
+        logger.debug("on_save_clicked called")
 
         # Auto-apply crop if pending
         if self.processor._is_cropping:
             self.processor.apply_crop()
-            self.canvas.queue_draw()
-
-        if self.file_dialog is not None:
-            print("DEBUG: Another dialog is already open.")
-            return
-
-        self.file_dialog = Gtk.FileChooserDialog(
-            title="Save Image As", transient_for=self, action=Gtk.FileChooserAction.SAVE
-        )
-        self.file_dialog.add_buttons(
-            "_Cancel", Gtk.ResponseType.CANCEL, "_Save", Gtk.ResponseType.ACCEPT
-        )
-        print("DEBUG: Gtk.FileChooserDialog for save created")
+            self.canvas.request_redraw()
+
+        if self._save_dialog is None:
+            self._save_dialog = Gtk.FileDialog(title="Save Image As", modal=True)
+            logger.debug("Gtk.FileDialog for save created")
+
+            # Add filter for PNG files
+            filter_png = Gtk.FileFilter()
+            filter_png.set_name("PNG images")
+            filter_png.add_mime_type("image/png")
+            filter_png.add_pattern("*.png")
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters.append(filter_png)
+            self._save_dialog.set_filters(filters)
+            self._save_dialog.set_default_filter(filter_png)
+            logger.debug("PNG filter added")
 
         # Pre-insert filename
         if self.processor.image_path:
             filename = os.path.basename(self.processor.image_path)
-            self.file_dialog.set_current_name(filename)
-            print(f"DEBUG: Setting initial name from existing path: {filename}")
+            logger.debug("Setting initial name from existing path: %s", filename)
         else:
             now = datetime.datetime.now()
             filename = now.strftime("image-%Y-%m-%dT%H-%M-%S.png")
-            self.file_dialog.set_current_name(filename)
-            print(f"DEBUG: Setting initial name to new timestamp: {filename}")
-
-        # Add filter for PNG files
-        filter_png = Gtk.FileFilter()
-        filter_png.set_name("PNG images")
-        filter_png.add_mime_type("image/png")
-        filter_png.add_pattern("*.png")
-        self.file_dialog.add_filter(filter_png)
-        print("DEBUG: PNG filter added")
-
-        self.file_dialog.connect("response", self._on_save_dialog_response)
-        print("DEBUG: 'response' signal connected for save")
-        self.file_dialog.show()
-        print("DEBUG: save dialog.show() called")
-
-    def _on_save_dialog_response(self, dialog, response_id):
-        """Handle the response from the file chooser dialog."""
-        print(f"DEBUG: _on_save_dialog_response called with response_id: {response_id}")
-        if response_id == Gtk.ResponseType.ACCEPT:
-            print("DEBUG: Save response is ACCEPT")
-            try:
-                file = dialog.get_file()
-                if file:
-                    path = file.get_path()
-                    print(f"DEBUG: Saving to path: {path}")
-                    # Ensure the filename has a .png extension if not provided
-                    if not path.lower().endswith(".png"):
-                        path += ".png"
-                        print(f"DEBUG: Appended .png, new path: {path}")
-                    self.processor.save_image(path)
-                    print("DEBUG: processor.save_image called")
-                else:
-                    print("DEBUG: dialog.get_file() returned None for save")
-            except GLib.Error as e:
-                print(f"DEBUG: GLib.Error on save: {e}")
-                if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
-                    self.show_error(f"Failed to save file: {e}")
-            except Exception as e:
-                print(f"DEBUG: Exception on save: {e}")
-                self.show_error(f"An error occurred while saving the file: {e}")
-        else:
-            print("DEBUG: Save response is not ACCEPT")
+            logger.debug("Setting initial name to new timestamp: %s", filename)
+        self._save_dialog.set_initial_name(filename)
+
+        self._save_dialog.save(self, None, self._on_save_dialog_finish)
+        logger.debug("save dialog.save() called")
 
-        dialog.destroy()
-        self.file_dialog = None
-        print("DEBUG: save dialog destroyed")
+    def _on_save_dialog_finish(self, dialog, result):
+        """Handle the result of the save file dialog."""
+        logger.debug("_on_save_dialog_finish called")
+        try:
+            file = dialog.save_finish(result)
+            if file:
+                path = file.get_path()
+                logger.debug("Saving to path: %s", path)
+                # Ensure the filename has a .png extension if not provided
+                if not path.lower().endswith(".png"):
+                    path += ".png"
+                    logger.debug("Appended .png, new path: %s", path)
+                self.processor.save_image(path)
+                logger.debug("processor.save_image called")
+            else:
+                logger.debug("dialog.save_finish() returned None")
+        except GLib.Error as e:
+            if _is_dialog_dismissed(e):
+                logger.debug("Save dialog dismissed")
+                return
+            logger.debug("GLib.Error on save: %s", e)
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                self.show_error(f"Failed to save file: {e}")
+        except Exception as e:
+            logger.debug("Exception on save: %s", e)
+            self.show_error(f"An error occurred while saving the file: {e}")
 
-    def on_tool_toggled(self, button, tool_name):
+    def on_tool_toggled(self, button, tool):
         """Handle tool selection from toggle buttons."""
         if button.get_active():
             if self.processor._is_cropping:
                 self.processor.cancel_crop()
-                self.canvas.queue_draw()
-            self.manager.current_tool = tool_name
+                self.canvas.request_redraw()
+            self.manager.current_tool = tool
             self._update_tool_ui()
 
     def on_crop_clicked(self, widget):
@@ -631,38 +795,57 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.processor._is_cropping:
             self.processor.apply_crop()
         elif self.processor._selection_box:
-            self.manager.current_tool = "select"  # Ensure no other tool is active
+            self.manager.current_tool = Tool.SELECT  # Ensure no other tool is active
             self.select_button.set_active(True)
             self.processor.start_crop()
-        self.canvas.queue_draw()
+        self.canvas.request_redraw()
 
     def on_tool_size_changed(self, scale):
-        """Handle tool size change."""
-        size = int(scale.get_value())
-        if self.manager.current_tool == "brush":
+        """Handle tool size change.
+
+        A slider drag emits value-changed many times per frame, so only the
+        latest value is kept and applied once per 16 ms frame.
+        """
+        self._pending_size = (self.manager.current_tool, int(scale.get_value()))
+        if self._size_timeout_id is None:
+            self._size_timeout_id = GLib.timeout_add(16, self._apply_pending_size)
+
+    def _apply_pending_size(self):
+        """Timeout callback applying the last size picked on the slider."""
+        self._size_timeout_id = None
+        tool, size = self._pending_size
+        if tool == Tool.BRUSH:
             self.processor.set_brush_size(size)
-        elif self.manager.current_tool == "text":
+        elif tool == Tool.TEXT:
             self.processor.set_text_size(size)
             self.canvas.update_text_color(self.processor._brush_color)
+        return GLib.SOURCE_REMOVE
 
     def on_brush_color_set(self, color_button):
         """Handle brush color change."""
         color = color_button.get_rgba()
         # Convert Gdk.RGBA to a tuple of (r, g, b, a) in 0-255 range
         rgba_255 = (
-            int(color.red * 255),
-            int(color.green * 255),
-            int(color.blue * 255),
-            int(color.alpha * 255),
+            int(color.red * 255 + 0.5),
+            int(color.green * 255 + 0.5),
+            int(color.blue * 255 + 0.5),
+            int(color.alpha * 255 + 0.5),
         )
+        r, g, b, a = rgba_255
+        packed = (a << 24) | (r << 16) | (g << 8) | b
+        if packed == self._last_brush_packed:
+            # Same 8-bit color; the stamp and entry style are already current
+            return
+        self._last_brush_packed = packed
         self.processor.set_brush_color(rgba_255)
         self.canvas.update_text_color(rgba_255)
 
     def on_font_changed(self, dropdown, pspec):
         """Handle font selection."""
-        selected_item = dropdown.get_selected_item()
-        if not selected_item:
+        # The position indexes the fixed family list directly, so the
+        # dropdown's string object is never unwrapped
+        selected = dropdown.get_selected()
+        if selected >= len(_FONT_FAMILIES):  # Includes INVALID_LIST_POSITION
             return
 
-        font_desc = selected_item.get_string()
-        self.processor.set_font_path(font_desc)
+        self.processor.set_font_path(_FONT_FAMILIES[selected])